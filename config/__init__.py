@@ -5,7 +5,7 @@ This package contains all configuration modules for the Smart Security System.
 Includes settings management and GPIO pin mappings.
 """
 
-from .settings import Settings
+from .settings import Settings, ConfigError
 from .gpio_pins import GPIOPins
 
-__all__ = ['Settings', 'GPIOPins']
+__all__ = ['Settings', 'ConfigError', 'GPIOPins']
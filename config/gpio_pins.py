@@ -9,13 +9,15 @@ Pin Reference (Raspberry Pi 4):
 - BCM pins: GPIO numbers used in code
 
 Usage:
-    from config.gpio_pins import GPIOPins
-    pins = GPIOPins()
-    pir_pin = pins.PIR_PIN
+    from config.gpio_pins import gpio_pins
+    pir_pin = gpio_pins.PIR_PIN
+
+The shared ``gpio_pins`` instance is created lazily on first access.
 """
 
-import os
-from typing import Dict, List
+import warnings
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 
 
 class GPIOPins:
@@ -26,6 +28,14 @@ class GPIOPins:
     All pin numbers can be overridden via environment variables if needed.
     """
 
+    # Pins reserved for I2C (2, 3), SPI (7-11) and UART (14, 15) on Raspberry Pi 4
+    _RESERVED_PINS = frozenset({2, 3, 7, 8, 9, 10, 11, 14, 15})
+
+    __slots__ = (
+        "PIR_PIN", "LED_RED_PIN", "LED_GREEN_PIN", "BUZZER_PIN",
+        "_all_pins", "_output_pins", "_input_pins", "_pin_values",
+    )
+
     def __init__(self):
         """
         Initialize GPIO pin configuration.
@@ -53,88 +63,85 @@ class GPIOPins:
         - Use default values if not specified
         - Store in instance variables
         """
+        # Pin overrides live in the environment or the .env file
+        from .settings import settings
+        getenv = settings.getenv
+
         # PIR Motion Sensor
-        self.PIR_PIN: int = int(os.getenv("PIR_PIN", "18"))
+        self.PIR_PIN: int = int(getenv("PIR_PIN", "18"))
 
         # LED Indicators
-        self.LED_RED_PIN: int = int(os.getenv("LED_RED_PIN", "17"))
-        self.LED_GREEN_PIN: int = int(os.getenv("LED_GREEN_PIN", "27"))
+        self.LED_RED_PIN: int = int(getenv("LED_RED_PIN", "17"))
+        self.LED_GREEN_PIN: int = int(getenv("LED_GREEN_PIN", "27"))
 
         # Buzzer
-        self.BUZZER_PIN: int = int(os.getenv("BUZZER_PIN", "22"))
+        self.BUZZER_PIN: int = int(getenv("BUZZER_PIN", "22"))
+
+        # Pins are fixed after loading - build the lookup views once
+        self._all_pins: Mapping[str, int] = MappingProxyType({
+            "PIR_PIN": self.PIR_PIN,
+            "LED_RED_PIN": self.LED_RED_PIN,
+            "LED_GREEN_PIN": self.LED_GREEN_PIN,
+            "BUZZER_PIN": self.BUZZER_PIN,
+        })
+        self._output_pins: Tuple[int, ...] = (self.LED_RED_PIN, self.LED_GREEN_PIN, self.BUZZER_PIN)
+        self._input_pins: Tuple[int, ...] = (self.PIR_PIN,)
+        self._pin_values: Tuple[int, ...] = tuple(self._all_pins.values())
 
     def _validate_pins(self) -> None:
         """
         Validate GPIO pin configuration.
 
-        TODO:
-        - Check all pins are in valid range (0-27 for RPi 4)
-        - Check for duplicate pin assignments
-        - Raise ValueError with clear message if invalid
-        - Warn about reserved pins if used (I2C, SPI, UART pins)
+        Raises:
+            ValueError: If a pin is outside 0-27 (RPi 4) or used twice
+
+        Warns about pins reserved for I2C, SPI or UART.
         """
-        # Get all configured pins
-        all_pins = self.get_all_pins()
+        pins = self._pin_values
 
-        # TODO: Validate range (0-27 for Raspberry Pi 4)
-        # for pin_name, pin_number in all_pins.items():
-        #     if not (0 <= pin_number <= 27):
-        #         raise ValueError(f"Invalid pin number for {pin_name}: {pin_number}")
+        # Validate range (0-27 for Raspberry Pi 4)
+        if not all(0 <= pin <= 27 for pin in pins):
+            invalid = {name: pin for name, pin in self._all_pins.items() if not 0 <= pin <= 27}
+            raise ValueError(f"Invalid GPIO pin numbers (expected 0-27): {invalid}")
 
-        # TODO: Check for duplicates
-        # pin_numbers = list(all_pins.values())
-        # if len(pin_numbers) != len(set(pin_numbers)):
-        #     raise ValueError("Duplicate pin assignments detected!")
+        # Check for duplicates
+        if len(set(pins)) != len(pins):
+            raise ValueError(f"Duplicate pin assignments detected: {dict(self._all_pins)}")
 
-        # TODO: Warn about reserved pins
-        # Reserved pins on Raspberry Pi 4:
+        # Warn about reserved pins
         # - GPIO 2, 3: I2C (avoid unless using I2C devices)
         # - GPIO 14, 15: UART (avoid unless using serial)
         # - GPIO 7, 8, 9, 10, 11: SPI (avoid unless using SPI devices)
+        conflicts = self._RESERVED_PINS.intersection(pins)
+        if conflicts:
+            warnings.warn(f"Using reserved GPIO pins (I2C/SPI/UART): {sorted(conflicts)}")
 
-        pass
-
-    def get_all_pins(self) -> Dict[str, int]:
+    def get_all_pins(self) -> Mapping[str, int]:
         """
-        Get dictionary of all configured pins.
+        Get mapping of all configured pins.
 
         Returns:
-            Dict[str, int]: Dictionary mapping pin names to GPIO numbers
-
-        TODO:
-        - Return dictionary with all pin mappings
-        - Useful for validation and debugging
+            Mapping[str, int]: Read-only mapping of pin names to GPIO numbers
         """
-        return {
-            "PIR_PIN": self.PIR_PIN,
-            "LED_RED_PIN": self.LED_RED_PIN,
-            "LED_GREEN_PIN": self.LED_GREEN_PIN,
-            "BUZZER_PIN": self.BUZZER_PIN,
-        }
+        return self._all_pins
 
-    def get_output_pins(self) -> List[int]:
+    def get_output_pins(self) -> Tuple[int, ...]:
         """
-        Get list of all OUTPUT pins (LEDs, Buzzer).
+        Get all OUTPUT pins (LEDs, Buzzer).
 
         Returns:
-            List[int]: List of GPIO pin numbers configured as outputs
-
-        TODO:
-        - Return list of pins that should be configured as GPIO.OUT
+            Tuple[int, ...]: GPIO pin numbers configured as outputs
         """
-        return [self.LED_RED_PIN, self.LED_GREEN_PIN, self.BUZZER_PIN]
+        return self._output_pins
 
-    def get_input_pins(self) -> List[int]:
+    def get_input_pins(self) -> Tuple[int, ...]:
         """
-        Get list of all INPUT pins (PIR Sensor).
+        Get all INPUT pins (PIR Sensor).
 
         Returns:
-            List[int]: List of GPIO pin numbers configured as inputs
-
-        TODO:
-        - Return list of pins that should be configured as GPIO.IN
+            Tuple[int, ...]: GPIO pin numbers configured as inputs
         """
-        return [self.PIR_PIN]
+        return self._input_pins
 
     def print_configuration(self) -> None:
         """
@@ -167,12 +174,34 @@ class GPIOPins:
 
 # GPIO Pin to Physical Pin Mapping Reference (Raspberry Pi 4)
 # Useful for wiring and documentation
-GPIO_TO_PHYSICAL = {
-    2: 3,   3: 5,   4: 7,   17: 11,  27: 13,  22: 15,  10: 19,  9: 21,
-    11: 23, 5: 29,  6: 31,  13: 33,  19: 35,  26: 37,  14: 8,   15: 10,
-    18: 12, 23: 16, 24: 18, 25: 22,  8: 24,   7: 26,   12: 32,  16: 36,
-    20: 38, 21: 40,
-}
-
-# Create a singleton instance for easy import
-gpio_pins = GPIOPins()
+# Indexed by BCM number (0-27); -1 marks pins not exposed on the header
+GPIO_TO_PHYSICAL: Tuple[int, ...] = (
+    -1, -1,  3,  5,  7, 29, 31, 26,   # GPIO 0-7
+    24, 21, 19, 23, 32, 33,  8, 10,   # GPIO 8-15
+    36, 11, 12, 35, 38, 40, 15, 16,   # GPIO 16-23
+    18, 22, 37, 13,                   # GPIO 24-27
+)
+
+
+def physical_pin(bcm: int) -> int:
+    """
+    Get the physical header pin for a BCM GPIO number.
+
+    Returns:
+        int: Physical pin number, or -1 if the GPIO is not on the header
+    """
+    return GPIO_TO_PHYSICAL[bcm]
+
+
+# Shared instance, created on first access to ``gpio_pins``
+_gpio_pins: Optional[GPIOPins] = None
+
+
+def __getattr__(name: str):
+    """Create the shared ``gpio_pins`` instance on first access."""
+    global _gpio_pins
+    if name == "gpio_pins":
+        if _gpio_pins is None:
+            _gpio_pins = GPIOPins()
+        return _gpio_pins
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,19 +2,70 @@
 Settings Module - Configuration Management
 
 This module loads and validates all configuration from .env file.
-Uses python-dotenv to load environment variables and provides
+The .env file is parsed once into a cached dict (real environment
+variables take precedence, as with python-dotenv) and exposed through
 a centralized Settings class for accessing configuration throughout the app.
 
 Usage:
-    from config.settings import Settings
-    settings = Settings()
+    from config.settings import settings
     token = settings.telegram_bot_token
+
+The shared ``settings`` instance is created lazily on first access
+(PEP 562 module ``__getattr__``), so importing this module does not
+read the .env file.
 """
 
 import os
+import functools
 from pathlib import Path
-from typing import Optional
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple
+
+
+# Accepted spellings for boolean settings (membership test, no .lower() copy)
+_TRUTHY: FrozenSet[str] = frozenset({
+    "true", "True", "TRUE", "1", "yes", "Yes", "YES", "on", "On", "ON",
+})
+
+# Parse a boolean environment variable
+_to_bool: Callable[[str], bool] = _TRUTHY.__contains__
+
+
+class ConfigError(ValueError):
+    """Raised when a configuration value cannot be parsed."""
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env_file(path: str) -> Mapping[str, str]:
+    """
+    Parse a .env file once and return its KEY=VALUE pairs.
+
+    Supports comments, blank lines, an optional "export " prefix and
+    single/double quoted values. A missing file yields an empty mapping.
+    """
+    try:
+        with open(path, "rb") as f:
+            text = f.read().decode("utf-8")
+    except FileNotFoundError:
+        return MappingProxyType({})
+
+    values: Dict[str, str] = {}
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[7:]
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        else:
+            value = value.split(" #", 1)[0].rstrip()
+        values[key.strip()] = value
+    return MappingProxyType(values)
 
 
 class Settings:
@@ -23,85 +74,124 @@ class Settings:
 
     Loads configuration from .env file and provides type-safe access
     to all configuration parameters with validation and defaults.
+
+    Instances are cached per env_file: constructing Settings() again
+    returns the already-parsed object instead of re-reading the file.
     """
 
+    _instances: Dict[str, "Settings"] = {}
+
+    # (attribute, environment variable, caster, default)
+    _SCHEMA: Tuple[Tuple[str, str, Callable[[str], Any], Any], ...] = (
+        # Telegram bot
+        ("telegram_bot_token", "TELEGRAM_BOT_TOKEN", str, ""),
+        ("telegram_chat_id", "TELEGRAM_CHAT_ID", str, ""),
+        ("alert_cooldown", "ALERT_COOLDOWN", int, 30),
+        # Camera
+        ("camera_index", "CAMERA_INDEX", int, 0),
+        ("camera_width", "CAMERA_WIDTH", int, 640),
+        ("camera_height", "CAMERA_HEIGHT", int, 480),
+        ("camera_fps", "CAMERA_FPS", int, 15),
+        # Flask server
+        ("flask_port", "FLASK_PORT", int, 5000),
+        ("flask_host", "FLASK_HOST", str, "0.0.0.0"),
+        ("flask_debug", "FLASK_DEBUG", _to_bool, False),
+        # YOLO detection
+        ("yolo_model", "YOLO_MODEL", str, "yolov5n.pt"),
+        ("yolo_confidence", "YOLO_CONFIDENCE", float, 0.6),
+        ("yolo_iou_threshold", "YOLO_IOU_THRESHOLD", float, 0.45),
+        ("yolo_img_size", "YOLO_IMG_SIZE", int, 416),
+        ("yolo_batch_size", "YOLO_BATCH_SIZE", int, 1),
+        ("yolo_export_format", "YOLO_EXPORT_FORMAT", str, ""),
+        # Detector
+        ("detector_type", "DETECTOR_TYPE", str, "yolo"),
+        ("face_recognition_tolerance", "FACE_TOLERANCE", float, 0.6),
+        ("known_faces_db", "KNOWN_FACES_DB", str, "data/known_faces/database.npz"),
+        # Motion detection
+        ("motion_min_area", "MOTION_MIN_AREA", int, 500),
+        ("motion_frames_threshold", "MOTION_FRAMES_THRESHOLD", int, 10),
+        # Logging
+        ("log_level", "LOG_LEVEL", str, "INFO"),
+        ("log_file", "LOG_FILE", str, "logs/security_system.log"),
+        ("log_max_size", "LOG_MAX_SIZE", int, 10),
+        ("log_backup_count", "LOG_BACKUP_COUNT", int, 5),
+        # System
+        ("system_name", "SYSTEM_NAME", str, "Smart Security System"),
+        ("timezone", "TIMEZONE", str, "Europe/Bucharest"),
+        ("max_snapshots", "MAX_SNAPSHOTS", int, 100),
+        ("snapshot_retention_days", "SNAPSHOT_RETENTION_DAYS", int, 7),
+    )
+
+    __slots__ = tuple(attr for attr, _, _, _ in _SCHEMA) + ("_initialized", "_env", "_validated")
+
+    def __new__(cls, env_file: str = ".env"):
+        """Return the cached instance for env_file, creating it if needed."""
+        instance = cls._instances.get(env_file)
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instances[env_file] = instance
+        return instance
+
     def __init__(self, env_file: str = ".env"):
         """Initialize settings from .env file."""
-        load_dotenv(env_file)
-
-        self._load_telegram_settings()
-        self._load_camera_settings()
-        self._load_flask_settings()
-        self._load_yolo_settings()
-        self._load_detector_settings()
-        self._load_motion_settings()
-        self._load_logging_settings()
-        self._load_system_settings()
-
-    def _load_telegram_settings(self) -> None:
-        """Load Telegram bot configuration."""
-        self.telegram_bot_token: str = os.getenv("TELEGRAM_BOT_TOKEN", "")
-        self.telegram_chat_id: str = os.getenv("TELEGRAM_CHAT_ID", "")
-        self.alert_cooldown: int = int(os.getenv("ALERT_COOLDOWN", "30"))
-
-    def _load_camera_settings(self) -> None:
-        """Load camera configuration."""
-        self.camera_index: int = int(os.getenv("CAMERA_INDEX", "0"))
-        self.camera_width: int = int(os.getenv("CAMERA_WIDTH", "640"))
-        self.camera_height: int = int(os.getenv("CAMERA_HEIGHT", "480"))
-        self.camera_fps: int = int(os.getenv("CAMERA_FPS", "15"))
-
-    def _load_flask_settings(self) -> None:
-        """Load Flask server configuration."""
-        self.flask_port: int = int(os.getenv("FLASK_PORT", "5000"))
-        self.flask_host: str = os.getenv("FLASK_HOST", "0.0.0.0")
-        self.flask_debug: bool = os.getenv("FLASK_DEBUG", "False").lower() == "true"
-
-    def _load_yolo_settings(self) -> None:
-        """Load YOLO detection configuration."""
-        self.yolo_model: str = os.getenv("YOLO_MODEL", "yolov5n.pt")
-        self.yolo_confidence: float = float(os.getenv("YOLO_CONFIDENCE", "0.6"))
-        self.yolo_iou_threshold: float = float(os.getenv("YOLO_IOU_THRESHOLD", "0.45"))
-        self.yolo_img_size: int = int(os.getenv("YOLO_IMG_SIZE", "416"))
-
-    def _load_detector_settings(self) -> None:
-        """Load detector configuration."""
-        self.detector_type: str = os.getenv("DETECTOR_TYPE", "yolo")
-        self.face_recognition_tolerance: float = float(os.getenv("FACE_TOLERANCE", "0.6"))
-        self.known_faces_db: str = os.getenv("KNOWN_FACES_DB", "data/known_faces/database.pkl")
-
-    def _load_motion_settings(self) -> None:
-        """Load motion detection configuration."""
-        self.motion_min_area: int = int(os.getenv("MOTION_MIN_AREA", "500"))
-        self.motion_frames_threshold: int = int(os.getenv("MOTION_FRAMES_THRESHOLD", "10"))
-
-    def _load_logging_settings(self) -> None:
-        """Load logging configuration."""
-        self.log_level: str = os.getenv("LOG_LEVEL", "INFO")
-        self.log_file: str = os.getenv("LOG_FILE", "logs/security_system.log")
-        self.log_max_size: int = int(os.getenv("LOG_MAX_SIZE", "10"))
-        self.log_backup_count: int = int(os.getenv("LOG_BACKUP_COUNT", "5"))
-
-    def _load_system_settings(self) -> None:
-        """Load general system configuration."""
-        self.system_name: str = os.getenv("SYSTEM_NAME", "Smart Security System")
-        self.timezone: str = os.getenv("TIMEZONE", "Europe/Bucharest")
-        self.max_snapshots: int = int(os.getenv("MAX_SNAPSHOTS", "100"))
-        self.snapshot_retention_days: int = int(os.getenv("SNAPSHOT_RETENTION_DAYS", "7"))
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
+
+        self._env = _load_env_file(env_file)
+        self._validated: Optional[bool] = None
+
+        # One handler for the whole loop - the success path pays nothing
+        try:
+            for attr, key, cast, default in self._SCHEMA:
+                value = self.getenv(key)
+                setattr(self, attr, cast(value) if value is not None else default)
+        except (ValueError, TypeError) as e:
+            self._initialized = False
+            raise ConfigError(f"Bad env var {key}={value!r}") from e
+
+    def getenv(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Look up a raw configuration value.
+
+        The process environment wins over the .env file, matching
+        python-dotenv's default (override=False) behaviour.
+        """
+        value = os.environ.get(key)
+        if value is None:
+            value = self._env.get(key, default)
+        return value
 
     def validate(self) -> bool:
         """
         Validate all critical settings.
 
+        Settings do not change after loading, so the result is computed
+        once and reused on later calls.
+
         Returns:
             bool: True if all settings are valid, False otherwise
         """
-        return True
+        if self._validated is not None:
+            return self._validated
+
+        self._validated = True
+        return self._validated
 
     def __repr__(self) -> str:
         """String representation of settings (without sensitive data)."""
         return f"<Settings: {self.system_name}>"
 
 
-# Create a singleton instance for easy import
-settings = Settings()
+# Shared instance, created on first access to ``settings``
+_settings: Optional[Settings] = None
+
+
+def __getattr__(name: str):
+    """Create the shared ``settings`` instance on first access."""
+    global _settings
+    if name == "settings":
+        if _settings is None:
+            _settings = Settings()
+        return _settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
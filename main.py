@@ -17,18 +17,25 @@ Example:
     python3 main.py --arm
 """
 
+import os
 import sys
 import argparse
-import time
+import threading
 import signal
 from pathlib import Path
 
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.core.system_manager import SystemManager
-from src.utils.logger import setup_logger, get_logger
-from config.settings import settings
+# Cap the OpenMP/BLAS thread pools before NumPy/PyTorch are imported (they
+# size them at import time), leaving a core for the capture, stream and
+# Telegram threads. Values already set in the environment win.
+_MATH_THREADS = str(max(1, (os.cpu_count() or 1) - 1))
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, _MATH_THREADS)
+
+# NOTE: SystemManager, the logger and settings are imported inside main()
+# after argument parsing, so `--help` does not pull in OpenCV/YOLO/GPIO.
 
 
 def parse_arguments():
@@ -53,21 +60,50 @@ def parse_arguments():
     return args
 
 
-def print_banner():
+_BANNER_TEMPLATE = (
+    "=" * 60 + "\n"
+    "    SMART SECURITY SYSTEM\n"
+    "    AI-Powered Intrusion Detection\n"
+    "    Version 1.0.0\n"
+    + "=" * 60 + "\n"
+    "System Name: {system_name}\n"
+    "Flask Server: http://0.0.0.0:{flask_port}\n"
+    "YOLO Model: {yolo_model}\n"
+    "Telegram Bot: {telegram}\n"
+    + "=" * 60 + "\n"
+    "\n"
+)
+
+
+# Encoded banner, built on the first print_banner() call (settings are lazy)
+_banner_bytes = None
+
+
+def print_banner(settings):
     """
     Print application banner.
+
+    Args:
+        settings: Loaded Settings instance
     """
-    print("=" * 60)
-    print("    SMART SECURITY SYSTEM")
-    print("    AI-Powered Intrusion Detection")
-    print("    Version 1.0.0")
-    print("=" * 60)
-    print(f"System Name: {settings.system_name}")
-    print(f"Flask Server: http://0.0.0.0:{settings.flask_port}")
-    print(f"YOLO Model: {settings.yolo_model}")
-    print(f"Telegram Bot: {'Enabled' if settings.telegram_bot_token else 'Disabled'}")
-    print("=" * 60)
-    print()
+    global _banner_bytes
+    if _banner_bytes is None:
+        _banner_bytes = _BANNER_TEMPLATE.format(
+            system_name=settings.system_name,
+            flask_port=settings.flask_port,
+            yolo_model=settings.yolo_model,
+            telegram='Enabled' if settings.telegram_bot_token else 'Disabled',
+        ).encode('utf-8')
+
+    # Write the pre-encoded bytes directly, skipping the text codec layer
+    out = getattr(sys.stdout, 'buffer', None)
+    if out is None:
+        sys.stdout.write(_banner_bytes.decode('utf-8'))
+        sys.stdout.flush()
+        return
+    sys.stdout.flush()
+    out.write(_banner_bytes)
+    out.flush()
 
 
 def main():
@@ -77,8 +113,13 @@ def main():
     # Parse arguments
     args = parse_arguments()
 
+    # Heavy imports (OpenCV, YOLO, GPIO) only once we know we will run
+    from config.settings import settings
+    from src.utils.logger import setup_logger
+    from src.core.system_manager import SystemManager
+
     # Print banner
-    print_banner()
+    print_banner(settings)
 
     # Setup logger
     logger = setup_logger()
@@ -101,12 +142,15 @@ def main():
             logger.info("Auto-arming system...")
             system.arm()
 
-        # Main loop - keep application running
+        # Main loop - block until SIGINT/SIGTERM instead of polling
         logger.info("System ready. Press Ctrl+C to stop.")
         logger.info(f"Web dashboard: http://0.0.0.0:{settings.flask_port}")
 
-        while True:
-            time.sleep(1)
+        stop_event = threading.Event()
+        signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+        signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+        stop_event.wait()
+        logger.info("Shutdown signal received")
 
     except KeyboardInterrupt:
         logger.info("\nKeyboard interrupt received")
@@ -0,0 +1,172 @@
+"""
+Quantize YOLO Script - INT8 OpenVINO Model for Edge CPUs
+
+This script builds an INT8 copy of the YOLO model with OpenVINO NNCF
+post-training quantization, calibrated on saved detection snapshots.
+The detector loads it instead of the FP32 model when
+YOLO_EXPORT_FORMAT=openvino.
+
+Calibration uses YOLODetector.preprocess(), so the INT8 model matches the
+live input only for that preprocessing and YOLO_IMG_SIZE. Re-run this
+script (after deleting the old *_int8_openvino_model directory) whenever
+either changes.
+
+Usage:
+    python scripts/quantize_yolo.py
+    python scripts/quantize_yolo.py --snapshots snapshots --samples 200
+
+Requirements:
+    pip install openvino nncf
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+
+# Image files used as calibration samples
+IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png")
+
+
+def collect_calibration_tensors(detector, snapshot_dir: Path, samples: int) -> list:
+    """
+    Preprocess up to `samples` snapshot images exactly like YOLODetector.
+
+    Returns:
+        list: (1, 3, img_size, img_size) float32 tensors
+    """
+    import cv2
+
+    paths = sorted(
+        (p for p in snapshot_dir.glob("*") if p.suffix.lower() in IMAGE_SUFFIXES),
+        reverse=True  # Newest snapshots first
+    )[:samples]
+
+    tensors = []
+    for path in paths:
+        frame = cv2.imread(str(path))
+        if frame is not None:
+            tensors.append(detector.preprocess(frame))
+    return tensors
+
+
+def export_fp32(detector, model_path: str) -> Path:
+    """
+    Export (or reuse) the FP32 OpenVINO model.
+
+    Returns:
+        Path: The *_openvino_model directory
+    """
+    from ultralytics import YOLO
+    from src.detection.yolo_detector import EXPORT_SUFFIXES
+
+    model = YOLO(model_path)
+    checkpoint = Path(getattr(model, 'ckpt_path', None) or model_path)
+    export_dir = checkpoint.with_name(checkpoint.stem + EXPORT_SUFFIXES["openvino"])
+
+    if not export_dir.exists():
+        print(f"Exporting FP32 OpenVINO model ({detector.img_size}x{detector.img_size})...")
+        export_dir = Path(model.export(format="openvino", imgsz=detector.img_size, dynamic=False))
+
+    return export_dir
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Quantize the YOLO model to INT8 with OpenVINO NNCF',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python scripts/quantize_yolo.py --samples 200
+
+Then use it by setting in .env:
+  YOLO_EXPORT_FORMAT=openvino
+
+Re-run after changing YOLO_IMG_SIZE or the detector's preprocessing
+(delete the old *_int8_openvino_model directory first).
+        """
+    )
+
+    parser.add_argument(
+        '--snapshots',
+        type=str,
+        default='snapshots',
+        help='Directory with calibration images (default: snapshots)'
+    )
+
+    parser.add_argument(
+        '--samples',
+        type=int,
+        default=200,
+        help='Maximum number of calibration images (default: 200)'
+    )
+
+    args = parser.parse_args()
+
+    # Heavy imports only once we know we will run
+    try:
+        import nncf
+        import openvino as ov
+    except ImportError:
+        print("❌ OpenVINO and NNCF are required: pip install openvino nncf")
+        return 1
+
+    from src.detection.yolo_detector import YOLODetector, INT8_OPENVINO_SUFFIX
+
+    detector = YOLODetector()
+
+    print("=" * 60)
+    print("  YOLO INT8 QUANTIZATION - Smart Security System")
+    print("=" * 60)
+    print(f"  Model: {detector.model_path}")
+    print(f"  Calibration: {args.snapshots} (up to {args.samples} images)")
+    print("=" * 60)
+
+    # Step 1: Calibration data
+    tensors = collect_calibration_tensors(detector, Path(args.snapshots), args.samples)
+    if not tensors:
+        print(f"\n❌ No calibration images found in {args.snapshots}. Exiting.")
+        return 1
+    print(f"Loaded {len(tensors)} calibration images")
+
+    # Step 2: FP32 OpenVINO model
+    fp32_dir = export_fp32(detector, detector.model_path)
+    fp32_xml = next(fp32_dir.glob("*.xml"))
+
+    # Step 3: Post-training quantization
+    print("Quantizing (this can take a few minutes)...")
+    ov_model = ov.Core().read_model(str(fp32_xml))
+    quantized = nncf.quantize(
+        ov_model,
+        nncf.Dataset(tensors),
+        preset=nncf.QuantizationPreset.MIXED,
+        subset_size=len(tensors)
+    )
+
+    # Step 4: Save next to the FP32 model, with its metadata (class names)
+    int8_dir = fp32_dir.with_name(fp32_dir.name.replace("_openvino_model", INT8_OPENVINO_SUFFIX))
+    int8_dir.mkdir(parents=True, exist_ok=True)
+    ov.save_model(quantized, str(int8_dir / fp32_xml.name))
+    metadata = fp32_dir / "metadata.yaml"
+    if metadata.exists():
+        shutil.copy(metadata, int8_dir / metadata.name)
+
+    print("\n" + "=" * 60)
+    print(f"✓ INT8 model saved: {int8_dir}")
+    print("=" * 60)
+    print("\nNext steps:")
+    print("  1. Update .env file:")
+    print("     YOLO_EXPORT_FORMAT=openvino")
+    print("  2. Restart the system")
+    print("=" * 60)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
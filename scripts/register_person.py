@@ -16,20 +16,147 @@ Instructions:
     5. Encodings will be saved to database
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import argparse
-import cv2
-import face_recognition
-import pickle
-import numpy as np
+import threading
+import time
 from datetime import datetime
 
-from config.settings import settings
+# NOTE: OpenCV, dlib/face_recognition, NumPy and the face database module
+# are imported by _load_dependencies() after argument parsing, so `--help`
+# and argument errors return without loading them.
+cv2 = None
+face_recognition = None
+np = None
+
+# On-disk quantization modes (mirrors face_database.QUANTIZE_MODES)
+QUANTIZE_CHOICES = ("int8",)
+
+
+def _load_dependencies():
+    """
+    Import the heavy dependencies into module globals and warm up dlib.
+
+    Safe to call repeatedly; also called in worker processes, which may
+    start from a fresh interpreter.
+    """
+    global cv2, face_recognition, np
+    global settings, load_face_database, save_face_database, from_dict, to_dict
+
+    if face_recognition is not None:
+        return
+
+    import cv2
+    import numpy as np
+    import face_recognition
+
+    from config.settings import settings
+    from src.detection.face_database import (
+        load_face_database, save_face_database, from_dict, to_dict
+    )
+
+    try:
+        import dlib
+        print(f"dlib CUDA: {'enabled' if dlib.DLIB_USE_CUDA else 'disabled'}")
+    except (ImportError, AttributeError):
+        pass
+
+    # Warm up dlib's HOG detector and ResNet encoder so the first preview
+    # frame does not stall on lazy model setup
+    warm = np.zeros((64, 64, 3), dtype=np.uint8)
+    face_recognition.face_locations(warm)
+    face_recognition.face_encodings(warm, [(0, 63, 63, 0)])
+
+
+# A warm 150x150 encode slower than this suggests dlib was built without SIMD/BLAS
+DLIB_SLOW_ENCODE_MS = 50
+
+# Preview face detection: run HOG every Nth frame on a downscaled copy
+DETECT_EVERY = 4
+PREVIEW_SCALE = 0.25
+
+
+def _check_dlib_speed():
+    """
+    Time one face encoding and warn if dlib looks like a generic build.
+
+    Prebuilt dlib wheels often lack AVX (x86) / NEON (ARM) and BLAS, which
+    makes encoding one to two orders of magnitude slower.
+    """
+    t = time.monotonic()
+    face_recognition.face_encodings(np.zeros((150, 150, 3), dtype=np.uint8), [(0, 149, 149, 0)])
+    dt_ms = (time.monotonic() - t) * 1000
+
+    if dt_ms > DLIB_SLOW_ENCODE_MS:
+        print(f"⚠️  dlib encode slow ({dt_ms:.0f}ms). Rebuild dlib with SIMD and BLAS, e.g.:")
+        print("     pip install --no-binary :all: --no-cache-dir dlib")
+        print("   with CMake flags -DUSE_AVX_INSTRUCTIONS=ON (x86) or -DUSE_NEON_INSTRUCTIONS=ON (ARM)")
+        print("   and -DDLIB_USE_BLAS=ON (-DDLIB_USE_MKL=ON on Intel). See requirements.txt notes.")
+
+
+class LatestFrame:
+    """
+    Background grabber that keeps only the most recent camera frame.
+
+    Decouples cap.read() from the preview loop so slow face detection
+    never leaves stale frames queued in the driver. The grabber owns the
+    capture and releases it when it stops.
+    """
+
+    def __init__(self, cap):
+        self.cap = cap
+        self.cond = threading.Condition()
+        self.frame = None
+        self.seq = 0  # Number of frames grabbed so far
+        self.failed = False
+        self.stop = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        """Read frames continuously into the single-slot buffer."""
+        try:
+            while not self.stop:
+                ret, frame = self.cap.read()
+                if not ret:
+                    break
+                with self.cond:
+                    self.frame = frame
+                    self.seq += 1
+                    self.cond.notify_all()
+        finally:
+            self.cap.release()
+            with self.cond:
+                self.failed = not self.stop
+                self.cond.notify_all()
+
+    def read(self, last_seq: int = 0, timeout: float = 1.0):
+        """
+        Wait for a frame newer than last_seq.
+
+        cap.read() allocates a new array per frame, so the frame is
+        returned without copying; callers must not modify it.
+
+        Returns:
+            tuple: (seq, frame), or (last_seq, None) on timeout or failure
+        """
+        with self.cond:
+            self.cond.wait_for(lambda: self.seq > last_seq or self.failed, timeout)
+            if self.seq > last_seq:
+                return self.seq, self.frame
+            return last_seq, None
+
+    def release(self):
+        """Stop the grabber thread and wait until it has released the camera."""
+        self.stop = True
+        self.thread.join()
 
 
 def capture_photos(name: str, num_photos: int = 5):
@@ -50,26 +177,59 @@ def capture_photos(name: str, num_photos: int = 5):
     print("  - Try different angles (front, left, right, up, down)")
     print("  - Press Q to quit\n")
 
-    # Open camera
-    cap = cv2.VideoCapture(0)
+    # Open camera (V4L2 directly on Linux, default backend elsewhere)
+    if sys.platform.startswith('linux'):
+        cap = cv2.VideoCapture(0, cv2.CAP_V4L2)
+    else:
+        cap = cv2.VideoCapture(0)
 
     if not cap.isOpened():
         print("❌ Error: Could not open camera")
         return []
 
+    # Request camera-side MJPG (less USB bandwidth than YUYV) and a
+    # single-frame driver buffer so reads never return stale frames
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
     # Set resolution
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+    cap.set(cv2.CAP_PROP_FPS, 30)
 
     captured_frames = []
     photo_count = 0
+    frame_idx = 0  # New camera frames shown so far
+    last_seq = 0   # Grabber sequence number of the last frame shown
+    preview_boxes = []  # Last preview detections, reused between detector runs
+    upscale = int(round(1 / PREVIEW_SCALE))
+
+    # Reusable colour-conversion buffers (allocated on the first frame)
+    rgb_buf = None
+    small_bgr = None
+    small_rgb = None
+
+    grabber = LatestFrame(cap)
 
     while photo_count < num_photos:
-        ret, frame = cap.read()
+        # Blocks until the camera delivers a new frame
+        last_seq, frame = grabber.read(last_seq)
+
+        if frame is None:
+            if grabber.failed:
+                print("❌ Error: Failed to read frame")
+                break
+            cv2.waitKey(1)
+            continue
 
-        if not ret:
-            print("❌ Error: Failed to read frame")
-            break
+        frame_idx += 1
+
+        if rgb_buf is None or rgb_buf.shape != frame.shape:
+            h, w = frame.shape[:2]
+            small_size = (int(w * PREVIEW_SCALE), int(h * PREVIEW_SCALE))
+            rgb_buf = np.empty_like(frame)
+            small_bgr = np.empty((small_size[1], small_size[0], 3), dtype=frame.dtype)
+            small_rgb = np.empty_like(small_bgr)
 
         # Display frame
         display_frame = frame.copy()
@@ -79,11 +239,18 @@ def capture_photos(name: str, num_photos: int = 5):
         cv2.putText(display_frame, text, (10, 30),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
 
-        # Draw face detection box if face found
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        face_locations = face_recognition.face_locations(rgb_frame)
-
-        for (top, right, bottom, left) in face_locations:
+        # Draw face detection box if face found (throttled, on a small frame)
+        if frame_idx % DETECT_EVERY == 0:
+            cv2.resize(frame, small_size, dst=small_bgr)
+            cv2.cvtColor(small_bgr, cv2.COLOR_BGR2RGB, dst=small_rgb)
+            preview_boxes = [
+                (top * upscale, right * upscale, bottom * upscale, left * upscale)
+                for (top, right, bottom, left) in face_recognition.face_locations(
+                    small_rgb, number_of_times_to_upsample=0, model="hog"
+                )
+            ]
+
+        for (top, right, bottom, left) in preview_boxes:
             cv2.rectangle(display_frame, (left, top), (right, bottom), (0, 255, 0), 2)
 
         cv2.imshow(f"Register {name}", display_frame)
@@ -91,25 +258,70 @@ def capture_photos(name: str, num_photos: int = 5):
         key = cv2.waitKey(1) & 0xFF
 
         if key == ord(' '):  # Space key
+            # Validate the capture with a fresh full-resolution detection
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+            face_locations = face_recognition.face_locations(rgb_buf)
+
             if len(face_locations) == 0:
                 print("⚠️  No face detected! Please try again.")
             elif len(face_locations) > 1:
                 print("⚠️  Multiple faces detected! Please ensure only one person is visible.")
             else:
-                captured_frames.append(frame.copy())
+                captured_frames.append(frame)
                 photo_count += 1
                 print(f"✓ Photo {photo_count}/{num_photos} captured!")
 
         elif key == ord('q'):  # Quit
             break
 
-    cap.release()
+    grabber.release()  # Also releases the camera
     cv2.destroyAllWindows()
 
     print(f"\n✓ Captured {len(captured_frames)} photos")
     return captured_frames
 
 
+def _encode_one(frame):
+    """
+    Detect and encode the face in one captured photo.
+
+    Runs in a worker process; dlib holds the GIL, so photos are spread
+    across processes rather than threads.
+
+    Args:
+        frame: Captured BGR frame
+
+    Returns:
+        tuple: (encoding or None, number of faces detected)
+    """
+    _load_dependencies()
+
+    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+    # IMPORTANT: Use 50% downsampling to match system detection scale
+    small_frame = cv2.resize(rgb_frame, (0, 0), fx=0.5, fy=0.5)
+
+    # Detect faces on downsampled frame. Unlike live detection
+    # (FaceRecognitionDetector, default upsample of 1), HOG runs without
+    # upsampling: that only limits how small a face it can find (~80px
+    # instead of ~40px), and registration photos are close-ups. The
+    # encoding is computed from landmarks inside the box, so the scale,
+    # not the upsampling, is what must match
+    face_locations = face_recognition.face_locations(
+        small_frame, number_of_times_to_upsample=0
+    )
+
+    if len(face_locations) == 0:
+        return None, 0
+
+    # Extract encoding of the first face from SAME downsampled frame (critical!)
+    face_encodings = face_recognition.face_encodings(
+        small_frame, face_locations[:1], num_jitters=1, model="small"
+    )
+
+    return (face_encodings[0] if face_encodings else None), len(face_locations)
+
+
 def extract_encodings(frames):
     """
     Extract face encodings from captured frames.
@@ -122,29 +334,25 @@ def extract_encodings(frames):
     """
     print("\n🔍 Extracting face encodings...")
 
-    encodings = []
-
-    for i, frame in enumerate(frames):
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-        # IMPORTANT: Use 50% downsampling to match system detection
-        small_frame = cv2.resize(rgb_frame, (0, 0), fx=0.5, fy=0.5)
+    if not frames:
+        return []
 
-        # Detect faces on downsampled frame
-        face_locations = face_recognition.face_locations(small_frame)
+    # Encode photos in parallel, one worker process per core
+    workers = min(len(frames), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_encode_one, frames))
 
-        if len(face_locations) == 0:
+    encodings = []
+    for i, (encoding, face_count) in enumerate(results):
+        if face_count == 0:
             print(f"  ⚠️  Photo {i+1}: No face detected, skipping")
             continue
 
-        if len(face_locations) > 1:
+        if face_count > 1:
             print(f"  ⚠️  Photo {i+1}: Multiple faces detected, using first one")
 
-        # Extract encoding from SAME downsampled frame (critical!)
-        face_encodings = face_recognition.face_encodings(small_frame, face_locations)
-
-        if len(face_encodings) > 0:
-            encodings.append(face_encodings[0])
+        if encoding is not None:
+            encodings.append(encoding)
             print(f"  ✓ Photo {i+1}: Encoding extracted")
         else:
             print(f"  ⚠️  Photo {i+1}: Failed to extract encoding")
@@ -153,13 +361,15 @@ def extract_encodings(frames):
     return encodings
 
 
-def save_to_database(name: str, encodings: list):
+def save_to_database(name: str, encodings: list, quantize: str = None):
     """
     Save person's encodings to database.
 
     Args:
         name: Person's name
         encodings: List of face encodings
+        quantize: Optional on-disk quantization ("int8"), applied to the
+            whole database
 
     Returns:
         bool: True if saved successfully
@@ -167,23 +377,20 @@ def save_to_database(name: str, encodings: list):
     print(f"\n💾 Saving to database...")
 
     db_path = Path(settings.known_faces_db)
-    db_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Load existing database
     if db_path.exists():
-        with open(db_path, 'rb') as f:
-            database = pickle.load(f)
+        database = to_dict(*load_face_database(db_path))
         print(f"  Loaded existing database with {len(database)} persons")
     else:
         database = {}
         print("  Creating new database")
 
-    # Add/Update person
-    database[name] = encodings
+    # Add/Update person (dlib returns float64; float32 loses no accuracy)
+    database[name] = [e.astype(np.float32, copy=False) for e in encodings]
 
-    # Save database
-    with open(db_path, 'wb') as f:
-        pickle.dump(database, f)
+    # Save database as one (N, 128) matrix plus parallel names
+    save_face_database(db_path, *from_dict(database), quantize=quantize)
 
     print(f"✓ Saved {len(encodings)} encodings for '{name}' to: {db_path}")
     print(f"\nDatabase now contains {len(database)} persons:")
@@ -224,8 +431,18 @@ Then run the system:
         help='Number of photos to capture (default: 5)'
     )
 
+    parser.add_argument(
+        '--quantize',
+        choices=QUANTIZE_CHOICES,
+        default=None,
+        help='Store encodings scalar-quantized (default: float32)'
+    )
+
     args = parser.parse_args()
 
+    # Heavy imports only once we know we will run
+    _load_dependencies()
+
     print("="  * 60)
     print("  FACE REGISTRATION - Smart Security System")
     print("=" * 60)
@@ -233,6 +450,8 @@ Then run the system:
     print(f"  Photos: {args.photos}")
     print("=" * 60)
 
+    _check_dlib_speed()
+
     # Step 1: Capture photos
     frames = capture_photos(args.name, args.photos)
 
@@ -256,7 +475,7 @@ Then run the system:
             return 1
 
     # Step 3: Save to database
-    save_to_database(args.name, encodings)
+    save_to_database(args.name, encodings, args.quantize)
 
     print("\n" + "=" * 60)
     print("✓ Registration complete!")
@@ -196,9 +196,6 @@ echo -e "${GREEN}✓ RPi.GPIO installed${NC}"
 # Install utilities (using system PIL/Pillow to avoid build issues)
 echo ""
 echo -e "${BLUE}Installing utilities...${NC}"
-pip install python-dotenv==1.0.0 --no-cache-dir
-echo -e "${GREEN}✓ python-dotenv installed${NC}"
-
 pip install requests==2.31.0 --no-cache-dir
 echo -e "${GREEN}✓ requests installed${NC}"
 
@@ -299,7 +296,6 @@ packages = {
     'flask': 'Flask',
     'telegram': 'Telegram Bot',
     'RPi.GPIO': 'GPIO',
-    'dotenv': 'python-dotenv',
     'requests': 'Requests'
 }
 
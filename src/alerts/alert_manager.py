@@ -33,22 +33,24 @@ Usage:
     # Manager automatically sends based on cooldown
 """
 
-from queue import PriorityQueue, Empty
+from collections import deque
 from typing import Optional, Dict
-from datetime import datetime, timedelta
+from datetime import datetime
 import threading
 import time
+import cv2
 import numpy as np
 
 from config.settings import settings
 from src.detection.yolo_detector import AlertLevel
+from src.utils.logger import get_queued_logger
 
 
 class Alert:
     """
     Alert data structure.
 
-    Implements comparison for priority queue ordering.
+    Ordering is handled by AlertManager's per-level buckets.
     """
 
     def __init__(
@@ -57,6 +59,8 @@ class Alert:
         message: str,
         frame: Optional[np.ndarray] = None,
         timestamp: Optional[datetime] = None,
+        frame_jpeg: Optional[bytes] = None,
+        frame_hash: Optional[int] = None,
     ):
         """
         Create alert.
@@ -69,17 +73,33 @@ class Alert:
         self.level = level
         self.message = message
         self.frame = frame
+        self.frame_jpeg = frame_jpeg  # Pre-encoded snapshot sent to Telegram
+        self.frame_hash = frame_hash  # 64-bit dHash for duplicate detection
         self.timestamp = timestamp or datetime.now()
         self.priority = level.value  # Higher value = higher priority
 
-    def __lt__(self, other):
-        """Compare alerts for priority queue (higher priority first)."""
-        return self.priority > other.priority
-
     def __repr__(self) -> str:
         return f"<Alert: {self.level.name}, {self.message[:30]}...>"
 
 
+# JPEG quality for alert snapshots encoded at queue time
+ALERT_JPEG_QUALITY = 80
+
+# Frames whose dHash differs in at most this many bits count as duplicates
+DUPLICATE_HASH_DISTANCE = 5
+
+
+def frame_dhash(frame: np.ndarray) -> int:
+    """
+    Compute a 64-bit difference hash (dHash) of a BGR frame.
+
+    Near-identical frames produce hashes with a small Hamming distance.
+    """
+    gray = cv2.cvtColor(cv2.resize(frame, (9, 8), interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+    diff = gray[:, 1:] > gray[:, :-1]
+    return int(np.packbits(diff.ravel()).view('>u8')[0])
+
+
 class AlertManager:
     """
     Manages alert queue, cooldown, and sending.
@@ -107,14 +127,22 @@ class AlertManager:
         - Track last alert time
         - Initialize statistics
         """
+        # Log I/O runs on a listener thread, off the alert pipeline
+        self.logger = get_queued_logger(__name__)
+
         self.telegram_bot = telegram_bot
         self.cooldown = cooldown_seconds or settings.alert_cooldown
 
-        self.queue = PriorityQueue()
+        # One FIFO bucket per AlertLevel, indexed by level value; with only
+        # four levels this beats a heap-backed PriorityQueue
+        self._buckets = [deque() for _ in AlertLevel]
+        self._cv = threading.Condition()
         self.processing_thread = None
         self.stop_event = threading.Event()
 
-        self.last_alert_time = None
+        # time.monotonic() of the last sent alert (immune to wall-clock jumps)
+        self.last_alert_time: Optional[float] = None
+        self._last_hash: Optional[int] = None  # dHash of the last sent alert frame
         self.alert_count = 0
         self.alerts_sent = 0
         self.alerts_dropped = 0
@@ -124,7 +152,7 @@ class AlertManager:
         Start alert processing thread.
         """
         if self.processing_thread is not None and self.processing_thread.is_alive():
-            print("Alert manager already running")
+            self.logger.warning("Alert manager already running")
             return
         
         # Clear stop event
@@ -136,7 +164,7 @@ class AlertManager:
         # Start thread
         self.processing_thread.start()
 
-        print("Alert manager started")
+        self.logger.info("Alert manager started")
 
 
     def add_alert(
@@ -148,20 +176,45 @@ class AlertManager:
         """
         Add alert to queue.
         """
+        frame_jpeg = None
+        frame_hash = None
+        if frame is not None:
+            # Drop near-duplicates of the last sent alert during cooldown
+            frame_hash = frame_dhash(frame)
+            if (
+                self._last_hash is not None
+                and self._is_in_cooldown()
+                and bin(frame_hash ^ self._last_hash).count("1") <= DUPLICATE_HASH_DISTANCE
+            ):
+                self.alert_count += 1
+                self.alerts_dropped += 1
+                return
+
+            # Encode the snapshot once so the queue holds ~50 KB of JPEG
+            # instead of a full raw frame
+            ok, buf = cv2.imencode('.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), ALERT_JPEG_QUALITY])
+            if ok:
+                frame_jpeg = buf.tobytes()
+            else:
+                self.logger.warning("Failed to encode alert frame, sending without image")
+
         # Create Alert object
         alert = Alert(
             level=level,
             message=message,
-            frame=frame
+            frame_jpeg=frame_jpeg,
+            frame_hash=frame_hash
         )
-        # Add to priority queue
-        self.queue.put(alert)
+        # Add to its priority bucket and wake the processing thread
+        with self._cv:
+            self._buckets[alert.priority].append(alert)
+            self._cv.notify()
 
         # Incremnt alert count
 
         self.alert_count += 1
 
-        print(f"Alert queued: {alert.level.name} - {message[:50]}")
+        self.logger.info(f"Alert queued: {alert.level.name} - {message[:50]}")
 
     def _process_loop(self) -> None:
         """
@@ -169,24 +222,16 @@ class AlertManager:
         """
         while not self.stop_event.is_set():
             try:
-                # Try to get alert from queue (without timeout)
-                try:
-                    alert = self.queue.get(timeout=1.0)
-                except Empty:
-                    # No alerts in queue, contiune loop
+                # Sleep until the cooldown expires (wakes early on stop)
+                wait_time = self._time_until_next_alert()
+                if wait_time > 0:
+                    self.stop_event.wait(wait_time)
                     continue
-                # Check cooldown
-                if self._is_in_cooldown():
-                    # In cooldown - put alert back and wait
-                    wait_time = self._time_until_next_alert()
-
-                    # Put alert back in queue 
-                    self.queue.put(alert)
-
-                    #  Wait for cooldown to expire (but check stop_event)
-                    if wait_time > 0:
-                        self.stop_event.wait(min(wait_time, 1.0))
-                    
+
+                # Block until an alert arrives
+                alert = self._get_next_alert(timeout=1.0)
+                if alert is None:
+                    # No alerts in queue, contiune loop
                     continue
 
                 # Cooldown passed - send alert
@@ -200,9 +245,21 @@ class AlertManager:
                 # Breif sleep between iteration
                 time.sleep(0.1)
             except Exception as e:
-                print(f"Error in alert processing loop: {e}")
+                self.logger.error(f"Error in alert processing loop: {e}")
                 time.sleep(0.1)
 
+    def _get_next_alert(self, timeout: float) -> Optional[Alert]:
+        """
+        Pop the highest-priority queued alert, waiting up to timeout seconds.
+        """
+        with self._cv:
+            if not any(self._buckets) and not self.stop_event.is_set():
+                self._cv.wait(timeout=timeout)
+            for bucket in reversed(self._buckets):
+                if bucket:
+                    return bucket.popleft()
+        return None
+
     def _send_alert(self, alert: Alert) -> bool:
         """
         Send alert via Telegram.
@@ -210,7 +267,7 @@ class AlertManager:
         try:
             # Check if telegram bot is configured
             if self.telegram_bot is None:
-                print(f"Telegram bot not configured, skipping alert")
+                self.logger.warning("Telegram bot not configured, skipping alert")
                 return False
             
             # Format alert message with level emoji
@@ -226,24 +283,25 @@ class AlertManager:
             # Call telegram_bot.send_alert()
             success = self.telegram_bot.send_alert(
                 message=formatted_message,
-                image=alert.frame
+                frame=alert.frame_jpeg
             )
             if success:
                 # Update last alert time
-                self.last_alert_time = datetime.now()
+                self.last_alert_time = time.monotonic()
+                self._last_hash = alert.frame_hash
 
                 # Increment alert sent
                 self.alerts_sent += 1
 
-                print(f"Alert sent successfully: {alert.level.name}")
+                self.logger.info(f"Alert sent successfully: {alert.level.name}")
 
                 return True
             else:
-                print(f"Failed to send alert: {alert.level.name}")
+                self.logger.warning(f"Failed to send alert: {alert.level.name}")
                 return False
             
         except Exception as e:
-            print(f"Error sending alert: {e}")
+            self.logger.error(f"Error sending alert: {e}")
             return False
                 
 
@@ -251,15 +309,11 @@ class AlertManager:
         """
         Check if in cooldown period.
         """
-        # If no previous alert, not in cooldown
-        if self.last_alert_time is None:
-            return False
-        
-        # Calculate time since last alert
-        time_since_last = (datetime.now() - self.last_alert_time).total_seconds()
-
-        # Retrun true if less that cooldown seconds
-        return time_since_last < self.cooldown
+        # Not in cooldown if no previous alert, otherwise compare elapsed time
+        return (
+            self.last_alert_time is not None
+            and (time.monotonic() - self.last_alert_time) < self.cooldown
+        )
     
 
     def _time_until_next_alert(self) -> float:
@@ -271,7 +325,7 @@ class AlertManager:
             return 0.0
         
         # Calulate time since last alert
-        time_since_last = (datetime.now() - self.last_alert_time).total_seconds()
+        time_since_last = time.monotonic() - self.last_alert_time
 
         # Calulate remaining cooldown time
         remaining = self.cooldown - time_since_last
@@ -284,13 +338,15 @@ class AlertManager:
         """
         Clear all queued alerts.
         """
-        # Count alerts in queue
-        count = self.queue.qszie()
+        with self._cv:
+            # Count alerts in queue
+            count = sum(len(bucket) for bucket in self._buckets)
 
-        # Clear queue by creating new PriorityQueue
-        self.queue = PriorityQueue()
+            # Clear every priority bucket
+            for bucket in self._buckets:
+                bucket.clear()
 
-        print(f"Cleared {count} alerts. form queue")
+        self.logger.info(f"Cleared {count} alerts from queue")
 
         return count
 
@@ -298,7 +354,7 @@ class AlertManager:
         """
         Get number of queued alerts.
         """
-        return self.queue.qsize()
+        return sum(len(bucket) for bucket in self._buckets)
 
     def set_cooldown(self, seconds: int) -> None:
         """
@@ -328,7 +384,7 @@ class AlertManager:
             'alert_count': self.alert_count,
             'alerts_sent': self.alerts_sent,
             'alerts_dropped': self.alerts_dropped,
-            'queue_size': self.queue.qsize(),
+            'queue_size': self.get_queue_size(),
             'send_rate': round(send_rate, 2)
         }   
 
@@ -337,10 +393,12 @@ class AlertManager:
         """
         Stop alert manager.
         """
-        print("Stopping alert manager...")
+        self.logger.info("Stopping alert manager...")
     
-        # Set stop event
+        # Set stop event and wake the processing thread
         self.stop_event.set()
+        with self._cv:
+            self._cv.notify_all()
         
         # Wait for processing thread to finish
         if self.processing_thread is not None and self.processing_thread.is_alive():
@@ -351,11 +409,11 @@ class AlertManager:
         
         # Log statistics
         stats = self.get_statistics()
-        print(f"Alert manager stopped:")
-        print(f"  Total alerts: {stats['alert_count']}")
-        print(f"  Alerts sent: {stats['alerts_sent']}")
-        print(f"  Alerts dropped: {stats['alerts_dropped']}")
-        print(f"  Cleared from queue: {cleared}")
+        self.logger.info(
+            f"Alert manager stopped: total={stats['alert_count']}, "
+            f"sent={stats['alerts_sent']}, dropped={stats['alerts_dropped']}, "
+            f"cleared={cleared}"
+        )
 
     def __repr__(self) -> str:
         """String representation."""
@@ -30,16 +30,151 @@ Usage:
     bot.stop()
 """
 
+import asyncio
+import html
+import queue
+import random
+import socket
+import threading
+import time
 import cv2
-from telegram import Update, Bot
+import psutil
+from telegram import Update, Bot, InputMediaPhoto
+from telegram.error import BadRequest, NetworkError, RetryAfter, TimedOut
+from telegram.constants import ParseMode
 from telegram.ext import Application, CommandHandler, ContextTypes
-import io
-from PIL import Image
+from telegram.request import HTTPXRequest
 import numpy as np
-from typing import Optional, Callable
-from datetime import datetime
+from pathlib import Path
+from typing import Optional, Callable, Union
 
 from config.settings import settings
+from src.utils.logger import get_recent_logs
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx (pip install httpx[http2])
+    HTTP_VERSION = '2'
+except ImportError:
+    HTTP_VERSION = '1.1'
+
+# Seconds to wait for Telegram to confirm an outgoing message/photo
+SEND_TIMEOUT = 10
+
+# Attempts per outgoing message/photo on flood control or network errors,
+# and the cap (seconds) of the exponential backoff between them
+SEND_MAX_TRIES = 3
+SEND_MAX_BACKOFF = 8
+
+# Local-time format for alert and snapshot captions
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# File name Telegram shows for uploaded JPEG bytes
+PHOTO_FILENAME = 'snapshot.jpg'
+
+# Longest side (pixels) of /snapshot photos; larger frames are downscaled
+SNAPSHOT_MAX_SIDE = 1280
+
+# Seconds a /status reply is reused for repeated requests
+STATUS_CACHE_TTL = 2.0
+
+# Concurrent connections for outgoing requests, so a photo upload does
+# not hold up command replies
+CONNECTION_POOL_SIZE = 8
+
+# Read timeout (seconds) for outgoing requests and for getUpdates long polls
+REQUEST_READ_TIMEOUT = 20
+POLL_READ_TIMEOUT = 30
+
+# Seconds Telegram may hold a getUpdates long poll open while idle
+POLL_TIMEOUT = 25
+
+# JPEG quality for photos encoded by the bot (OpenCV/libjpeg-turbo)
+JPEG_QUALITY = 85
+
+# Pending alerts beyond this are dropped instead of blocking detection
+ALERT_QUEUE_SIZE = 32
+
+# Identical alerts (same type and message) within this many seconds are sent once
+ALERT_COALESCE_WINDOW = 3.0
+
+# Photo alerts arriving within this many seconds of each other are sent
+# together as one media group (Telegram allows at most 10 per group)
+MEDIA_GROUP_WINDOW = 0.5
+MEDIA_GROUP_MAX = 10
+
+# Prime psutil's CPU counters so later cpu_percent(interval=None) calls
+# return the usage since the previous call without sleeping
+psutil.cpu_percent()
+
+# Fixed command replies
+_UNAUTHORIZED_TEXT = "⛔ Unauthorized access denied."
+
+_WELCOME_TEXT = (
+    "🔐 <b>Smart Security System</b>\n\n"
+    "Welcome! Bot is ready.\n\n"
+    "Use /help to see available commands."
+)
+
+_HELP_TEXT = (
+    "🔐 <b>Smart Security System - Commands</b>\n\n"
+    "🎮 <b>Control:</b>\n"
+    "/arm - Arm the security system\n"
+    "/disarm - Disarm the system\n"
+    "/status - Get system status\n\n"
+    "📸 <b>Media:</b>\n"
+    "/snapshot - Get current camera frame\n\n"
+    "📋 <b>Information:</b>\n"
+    "/logs - View recent events\n"
+    "/help - Show this help message\n"
+    "/server - View live dashboard URL\n"
+)
+
+# Alert type -> emoji shown in front of the alert message
+_EMOJI_MAP = {
+    'info': 'ℹ️',
+    'warning': '⚠️',
+    'critical': '🚨',
+    'person': '👤',
+    'animal': '🐾'
+}
+
+
+def _encode_snapshot(frame: np.ndarray) -> Optional[bytes]:
+    """
+    Downscale a BGR frame to SNAPSHOT_MAX_SIDE and encode it to JPEG.
+
+    Encode time and upload size scale with pixel count, so large captures
+    are shrunk with INTER_AREA first. Returns None if encoding fails.
+    """
+    h, w = frame.shape[:2]
+    scale = SNAPSHOT_MAX_SIDE / max(h, w)
+    if scale < 1:
+        frame = cv2.resize(
+            frame, (int(w * scale), int(h * scale)),
+            interpolation=cv2.INTER_AREA
+        )
+
+    # Encode BGR frame straight to JPEG (no RGB copy / PIL image)
+    success, encoded_frame = cv2.imencode(
+        '.jpg', frame,
+        [int(cv2.IMWRITE_JPEG_QUALITY), JPEG_QUALITY, int(cv2.IMWRITE_JPEG_OPTIMIZE), 1]
+    )
+    return encoded_frame.tobytes() if success else None
+
+
+def _discover_local_ip() -> Optional[str]:
+    """
+    Find the LAN address of this machine.
+
+    Connecting a UDP socket sends no packets; it only makes the kernel
+    pick the outgoing interface. Returns None if there is no route.
+    """
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except OSError:
+        return None
 
 
 class TelegramBot:
@@ -59,17 +194,27 @@ class TelegramBot:
         self.application = None
         self.bot = None
         self.loop = None
+        self._local_ip = None  # LAN address for /server, found in start()
         # Callbacks for system control (will be set by SystemManager)
         self.on_arm_callback = None
         self.on_disarm_callback = None
         self.get_status_callback = None
         self.get_snapshot_callback = None
 
+        # (time.monotonic() when built, /status reply text)
+        self._status_cache = (0.0, None)
+
+        # Alerts are sent by a worker thread so callers never wait on the network
+        self._alert_queue = queue.Queue(maxsize=ALERT_QUEUE_SIZE)
+        self._alert_thread = threading.Thread(target=self._alert_worker, daemon=True)
+        self._alert_thread.start()
+
     def start(self) -> None:
         """
         Start Telegram bot with polling.
         """
-        import asyncio
+        # Look up the LAN address once instead of on every /server
+        self._local_ip = _discover_local_ip()
 
         # Create event loop for this thread
         self.loop = asyncio.new_event_loop()
@@ -77,7 +222,27 @@ class TelegramBot:
         loop = self.loop # # Keep local variable for compatibility
 
         # Create Application
-        self.application = Application.builder().token(self.token).build()
+        # Pooled (and HTTP/2 when available) connections for sends; a
+        # separate single connection serves the long-poll getUpdates
+        request = HTTPXRequest(
+            connection_pool_size=CONNECTION_POOL_SIZE,
+            read_timeout=REQUEST_READ_TIMEOUT,
+            connect_timeout=10,
+            http_version=HTTP_VERSION
+        )
+        updates_request = HTTPXRequest(
+            connection_pool_size=1,
+            read_timeout=POLL_READ_TIMEOUT,
+            connect_timeout=10,
+            http_version=HTTP_VERSION
+        )
+        self.application = (
+            Application.builder()
+            .token(self.token)
+            .request(request)
+            .get_updates_request(updates_request)
+            .build()
+        )
         self.bot = self.application.bot
 
         # Register command handlers
@@ -98,10 +263,13 @@ class TelegramBot:
         loop.run_until_complete(self.application.initialize())
         loop.run_until_complete(self.application.start())
 
-        # Start polling for updates
+        # Start long polling; only command messages are handled, so
+        # skip every other update type
         loop.run_until_complete(self.application.updater.start_polling(
+            poll_interval=0.0,
+            timeout=POLL_TIMEOUT,
             drop_pending_updates=True,
-            allowed_updates=Update.ALL_TYPES
+            allowed_updates=[Update.MESSAGE]
         ))
 
         # Keep running forever (until stop is called)
@@ -115,37 +283,18 @@ class TelegramBot:
 
         if not self._is_authorized(chat_id):
             await update.message.reply_text(
-                f"⛔ Unauthorized access denied.\n"
+                f"{_UNAUTHORIZED_TEXT}\n"
                 f"Your chat ID: {chat_id}"
             )
             return
         
-        await update.message.reply_text(
-            "🔐 *Smart Security System*\n\n"
-            "Welcome! Bot is ready.\n\n"
-            "Use /help to see available commands.",
-            parse_mode="Markdown"
-        )
+        await update.message.reply_text(_WELCOME_TEXT, parse_mode=ParseMode.HTML)
 
     async def cmd_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """
         Handle /help command.
         """
-        help_text = (
-            "🔐 *Smart Security System - Commands*\n\n"
-            "🎮 *Control:*\n"
-            "/arm - Arm the security system\n"
-            "/disarm - Disarm the system\n"
-            "/status - Get system status\n\n"
-            "📸 *Media:*\n"
-            "/snapshot - Get current camera frame\n\n"
-            "📋 *Information:*\n"
-            "/logs - View recent events\n"
-            "/help - Show this help message\n"
-            "/server - View live dashboard URL\n"
-        )
-
-        await update.message.reply_text(help_text, parse_mode="Markdown")
+        await update.message.reply_text(_HELP_TEXT, parse_mode=ParseMode.HTML)
 
     async def cmd_arm(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """
@@ -154,7 +303,7 @@ class TelegramBot:
         chat_id = update.effective_chat.id
 
         if not self._is_authorized(chat_id):
-            await update.message.reply_text("⛔ Unauthorized access denied.")
+            await update.message.reply_text(_UNAUTHORIZED_TEXT)
             return
         
         # Call the callback if set
@@ -162,10 +311,10 @@ class TelegramBot:
             try:
                 self.on_arm_callback()
                 await update.message.reply_text(
-                    "✅ *System ARMED*\n\n"
+                    "✅ <b>System ARMED</b>\n\n"
                     "Security system is now acctive.\n"
                     "You will receive alerts for any detections.",
-                    parse_mode="Markdown"
+                    parse_mode=ParseMode.HTML
                 )
             except Exception as e:
                 await update.message.reply_text(
@@ -173,9 +322,9 @@ class TelegramBot:
                 )
         else:
             await update.message.reply_text(
-            "✅ *ARM command received*\n\n"
+            "✅ <b>ARM command received</b>\n\n"
             "(System callback not connected yet)",
-            parse_mode="Markdown"
+            parse_mode=ParseMode.HTML
         )
 
     async def cmd_disarm(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -185,7 +334,7 @@ class TelegramBot:
         chat_id = update.effective_chat.id
 
         if not self._is_authorized(chat_id):
-            await update.message.reply_text("⛔ Unauthorized access denied.")
+            await update.message.reply_text(_UNAUTHORIZED_TEXT)
             return
 
         # Call the callback if set
@@ -193,10 +342,10 @@ class TelegramBot:
             try:
                 self.on_disarm_callback()
                 await update.message.reply_text(
-                    "🔓 *System DISARMED*\n\n"
+                    "🔓 <b>System DISARMED</b>\n\n"
                     "Security system is now inactive.\n"
                     "No alerts will be sent.",
-                    parse_mode="Markdown"
+                    parse_mode=ParseMode.HTML
                 )
             except Exception as e:
                 await update.message.reply_text(
@@ -204,9 +353,9 @@ class TelegramBot:
                 )
         else:
             await update.message.reply_text(
-                "🔓 *DISARM command received*\n\n"
+                "🔓 <b>DISARM command received</b>\n\n"
                 "(System callback not connected yet)",
-                parse_mode="Markdown"
+                parse_mode=ParseMode.HTML
             )
 
     async def cmd_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -216,9 +365,16 @@ class TelegramBot:
         chat_id = update.effective_chat.id
     
         if not self._is_authorized(chat_id):
-            await update.message.reply_text("⛔ Unauthorized access denied.")
+            await update.message.reply_text(_UNAUTHORIZED_TEXT)
             return
         
+        # Reuse a recent reply instead of polling the system again
+        now = time.monotonic()
+        cached_at, cached_msg = self._status_cache
+        if cached_msg and now - cached_at < STATUS_CACHE_TTL:
+            await update.message.reply_text(cached_msg, parse_mode=ParseMode.HTML)
+            return
+
         # Get status from callback if set
         if self.get_status_callback:
             try:
@@ -226,40 +382,37 @@ class TelegramBot:
                 
                 # Format status message
                 status_msg = (
-                    f"📊 *System Status*\n\n"
-                    f"🔒 State: {status_data.get('state', 'Unknown')}\n"
-                    f"⏱ Uptime: {status_data.get('uptime', 'N/A')}\n"
+                    f"📊 <b>System Status</b>\n\n"
+                    f"🔒 State: {html.escape(str(status_data.get('state', 'Unknown')))}\n"
+                    f"⏱ Uptime: {html.escape(str(status_data.get('uptime', 'N/A')))}\n"
                     f"💻 CPU: {status_data.get('cpu', 'N/A')}%\n"
                     f"🧠 RAM: {status_data.get('ram', 'N/A')}%\n"
                     f"🌡 Temp: {status_data.get('temp', 'N/A')}°C\n"
-                    f"📸 Camera: {status_data.get('camera', 'Unknown')}\n"
+                    f"📸 Camera: {html.escape(str(status_data.get('camera', 'Unknown')))}\n"
                     f"🔍 Detections: {status_data.get('detections', 0)}\n"
-                    f"👤 Last detection: {status_data.get('last_detection', 'None')}"
+                    f"👤 Last detection: {html.escape(str(status_data.get('last_detection', 'None')))}"
                 )
-                
-                await update.message.reply_text(status_msg, parse_mode="Markdown")
             except Exception as e:
                 await update.message.reply_text(
                     f"❌ Error getting status: {e}"
                 )
+                return
         else:
-            # Default status when callback not set
-            import psutil
-            from datetime import datetime
-            
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Default status when callback not set (non-blocking CPU sample)
+            cpu_percent = psutil.cpu_percent(interval=None)
             ram_percent = psutil.virtual_memory().percent
             
             status_msg = (
-                f"📊 *System Status*\n\n"
+                f"📊 <b>System Status</b>\n\n"
                 f"🔒 State: Not connected\n"
                 f"💻 CPU: {cpu_percent}%\n"
                 f"🧠 RAM: {ram_percent}%\n"
                 f"📸 Camera: Unknown\n\n"
                 f"(System callback not connected yet)"
             )
-            
-            await update.message.reply_text(status_msg, parse_mode="Markdown")
+
+        self._status_cache = (now, status_msg)
+        await update.message.reply_text(status_msg, parse_mode=ParseMode.HTML)
 
     async def cmd_snapshot(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """
@@ -269,7 +422,7 @@ class TelegramBot:
         chat_id = update.effective_chat.id
 
         if not self._is_authorized(chat_id):
-            await update.message.reply_text("⛔ Unauthorized access denied.")
+            await update.message.reply_text(_UNAUTHORIZED_TEXT)
             return
         
         try:
@@ -284,22 +437,25 @@ class TelegramBot:
                 await update.message.reply_text("❌ Failed to capture snapshot")
                 return
 
-             # Convert frame using helper
-            from src.utils.helpers import frame_to_pil
-            pil_image = frame_to_pil(frame)
-
-            # Convert to BytesIO
-            bio = io.BytesIO()
-            pil_image.save(bio, format='JPEG', quality=85)
-            bio.seek(0)
+            if isinstance(frame, (bytes, bytearray)):
+                # Camera already produced a JPEG (e.g. MJPEG) - send it as-is
+                jpeg_bytes = bytes(frame)
+            else:
+                # Resize + encode on a worker thread so polling and other
+                # commands keep running on the event loop meanwhile
+                jpeg_bytes = await asyncio.to_thread(_encode_snapshot, frame)
+            if jpeg_bytes is None:
+                await update.message.reply_text("❌ Failed to encode snapshot")
+                return
 
             # Create caption with timestamp
-            from datetime import datetime
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            timestamp = time.strftime(TIMESTAMP_FORMAT)
             caption = f"📸 Snapshot\n🕒 {timestamp}"
 
             # Send photo (AWAIT - we're in async context)
-            await update.message.reply_photo(photo=bio, caption=caption)      
+            await update.message.reply_photo(
+                photo=jpeg_bytes, caption=caption, filename=PHOTO_FILENAME
+            )      
 
         except Exception as e:
             await update.message.reply_text(
@@ -313,14 +469,10 @@ class TelegramBot:
         chat_id = update.effective_chat.id
 
         if not self._is_authorized(chat_id):
-            await update.message.reply_text("⛔ Unauthorized access denied.")
+            await update.message.reply_text(_UNAUTHORIZED_TEXT)
             return
 
         try:
-            from config.settings import settings
-            from collections import deque
-            from pathlib import Path
-
             # Get log file path from settings
             log_path = Path(settings.log_file)
 
@@ -328,10 +480,9 @@ class TelegramBot:
                 await update.message.reply_text("📋 No logs available yet")
                 return
 
-            # Read last 15 lines (memory efficient with deque)
+            # Read last 15 lines (tail read from the end of the file)
             try:
-                with open(log_path, 'r', encoding='utf-8') as f:
-                    lines = list(deque(f, maxlen=15))
+                lines = get_recent_logs(15, str(log_path))
             except Exception as e:
                 await update.message.reply_text(f"❌ Error reading logs: {e}")
                 return
@@ -340,9 +491,9 @@ class TelegramBot:
             if not lines:
                 message = "📋 Log file is empty"
             else:
-                header = "📋 *Recent Logs (last 15 lines)*\n\n"
-                log_content = "".join(lines)
-                message = header + f"```\n{log_content}\n```"
+                header = "📋 <b>Recent Logs (last 15 lines)</b>\n\n"
+                log_content = "\n".join(lines)
+                message = header + f"<pre>{html.escape(log_content)}</pre>"
 
             # Handle Telegram 4096 char limit
             MAX_LENGTH = 4096
@@ -350,16 +501,18 @@ class TelegramBot:
                 # Reduce lines gradually
                 while len(message) > MAX_LENGTH and len(lines) > 5:
                     lines = lines[1:]  # Remove oldest line
-                    log_content = "".join(lines)
-                    message = header + f"```\n{log_content}\n```"
+                    log_content = "\n".join(lines)
+                    message = header + f"<pre>{html.escape(log_content)}</pre>"
 
-                # Final truncation if still too long
-                if len(message) > MAX_LENGTH:
-                    truncate_msg = "\n```\n... (truncated)"
-                    message = message[:MAX_LENGTH - len(truncate_msg)] + truncate_msg
+                # Final truncation if still too long (cut the raw text so
+                # no escape sequence or tag is split)
+                truncate_msg = "\n... (truncated)"
+                while len(message) > MAX_LENGTH:
+                    log_content = log_content[:len(log_content) - (len(message) - MAX_LENGTH)]
+                    message = header + f"<pre>{html.escape(log_content)}</pre>" + truncate_msg
 
-            # Send with Markdown formatting
-            await update.message.reply_text(message, parse_mode="Markdown")
+            # Send as HTML; log text is escaped, so it cannot break parsing
+            await update.message.reply_text(message, parse_mode=ParseMode.HTML)
 
         except Exception as e:
             await update.message.reply_text(f"❌ Error: {e}")
@@ -368,95 +521,257 @@ class TelegramBot:
     def send_alert(
         self,
         message: str,
-        frame: Optional[np.ndarray] = None,
+        frame: Optional[Union[np.ndarray, bytes]] = None,
         alert_type: str = "info"
-   ) -> None:
+   ) -> bool:
         """
-        Send alert message with optional image.
+        Queue alert message with optional image.
+
+        Returns immediately; the alert worker thread does the network I/O.
+        The image may be a BGR frame or already JPEG-encoded bytes.
+
+        Returns:
+            bool: True if the alert was queued, False if the queue is full
         """
         try:
             # Map alert type to emoji
-            emoji_map = {
-                'info': 'ℹ️',
-                'warning': '⚠️',
-                'critical': '🚨',
-                'person': '👤',
-                'animal': '🐾'
-            }
-            emoji = emoji_map.get(alert_type, 'ℹ️')
-
-            # Add timestamp
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            emoji = _EMOJI_MAP.get(alert_type, 'ℹ️')
+
+            # Add timestamp (YYYY-MM-DD HH:MM:SS)
+            timestamp = time.strftime(TIMESTAMP_FORMAT)
 
             # Format message with emoji and timestamp
             formatted_message = f"{emoji} {message}\n\n🕒 {timestamp}"
 
-             # Send based on frame availability
-            if frame is not None:
+            # Encode raw frames now so the queue never holds full images
+            if frame is not None and not isinstance(frame, (bytes, bytearray)):
+                frame = self._encode_jpeg(frame)
+
+            self._alert_queue.put_nowait((alert_type, message, formatted_message, frame))
+            return True
+
+        except queue.Full:
+            print(f"Alert queue full, dropping alert: {message[:50]}")
+            return False
+        except Exception as e:
+            print(f"Error sending alert: {e}")
+            return False
+
+    def _alert_worker(self) -> None:
+        """
+        Drain the alert queue (runs in thread).
+
+        Collects bursts of alerts for up to MEDIA_GROUP_WINDOW seconds and
+        sends their photos as a single media group. Coalesces identical
+        alerts within ALERT_COALESCE_WINDOW seconds and honours Telegram's
+        RetryAfter flood-control replies.
+        """
+        last_sent = {}  # (alert_type, message) -> time.monotonic() when sent
+        running = True
+
+        while running:
+            item = self._alert_queue.get()
+            if item is None:
+                break
+
+            # Gather whatever else arrives in the batching window
+            batch = [item]
+            deadline = time.monotonic() + MEDIA_GROUP_WINDOW
+            while len(batch) < MEDIA_GROUP_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
                 try:
-                    self.send_photo(frame, caption=formatted_message)
-                except Exception as e:
-                    print(f"Photo send failed, fallback to text: {e}")
-                    self.send_message(formatted_message)
-            else:
-                self.send_message(formatted_message)
+                    item = self._alert_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+
+            # Drop repeats of an alert sent moments ago (or earlier in this batch)
+            now = time.monotonic()
+            last_sent = {k: t for k, t in last_sent.items() if now - t < ALERT_COALESCE_WINDOW}
+            photos = []  # (key, caption, jpeg_bytes)
+            texts = []   # (key, text)
+            for alert_type, message, formatted_message, jpeg_bytes in batch:
+                key = (alert_type, message)
+                if key in last_sent:
+                    continue
+                last_sent[key] = now
+                if jpeg_bytes is not None:
+                    photos.append((key, formatted_message, jpeg_bytes))
+                else:
+                    texts.append((key, formatted_message))
+
+            if len(photos) > 1 and self._deliver_media_group(
+                [(caption, jpeg_bytes) for _, caption, jpeg_bytes in photos]
+            ):
+                photos = []
+
+            # Singles, and the photos of a group that failed
+            for key, caption, jpeg_bytes in photos:
+                if not self._deliver_alert(caption, jpeg_bytes):
+                    last_sent.pop(key, None)
+            for key, text in texts:
+                if not self._deliver_alert(text, None):
+                    last_sent.pop(key, None)
+
+    def _deliver_media_group(self, photos) -> bool:
+        """
+        Send several (caption, jpeg_bytes) photo alerts in one request.
+
+        Returns:
+            bool: True if the media group was delivered
+        """
+        media = [
+            InputMediaPhoto(media=jpeg_bytes, caption=caption or None, filename=PHOTO_FILENAME)
+            for caption, jpeg_bytes in photos
+        ]
+        try:
+            self._send_with_retry(
+                lambda: self.bot.send_media_group(chat_id=self.chat_id, media=media)
+            )
+            return True
+        except Exception as e:
+            print(f"Media group send failed, sending alerts one by one: {e}")
+            return False
+
+    def _deliver_alert(self, text: str, jpeg_bytes: Optional[bytes]) -> bool:
+        """
+        Send one alert, falling back to text if the photo fails.
 
+        Returns:
+            bool: True if the alert was delivered
+        """
+        if jpeg_bytes is not None:
+            try:
+                self._send_with_retry(lambda: self.bot.send_photo(
+                    chat_id=self.chat_id,
+                    photo=jpeg_bytes,
+                    caption=text or None,
+                    filename=PHOTO_FILENAME
+                ))
+                return True
+            except Exception as e:
+                print(f"Photo send failed, fallback to text: {e}")
+
+        try:
+            self._send_with_retry(lambda: self.bot.send_message(chat_id=self.chat_id, text=text))
+            return True
         except Exception as e:
             print(f"Error sending alert: {e}")
+            return False
 
-    def send_message(self, text: str) -> None:
+    def _send_with_retry(self, coro_factory: Callable, max_tries: int = SEND_MAX_TRIES) -> None:
         """
-        Send plain text message.
+        Run a Bot call on the bot loop, retrying transient failures.
+
+        RetryAfter waits as long as Telegram asks (plus jitter);
+        TimedOut/NetworkError back off exponentially up to SEND_MAX_BACKOFF.
+
+        Args:
+            coro_factory: Zero-argument callable returning a fresh coroutine
+            max_tries: Total attempts before the last error is raised
+        """
+        for attempt in range(max_tries):
+            try:
+                self._run_on_loop(coro_factory())
+                return
+            except BadRequest:
+                # A NetworkError subclass, but retrying will not help
+                raise
+            except RetryAfter as e:
+                if attempt == max_tries - 1:
+                    raise
+                delay = self._retry_after_seconds(e) + random.uniform(0, 0.5)
+                print(f"Telegram rate limit hit, retrying in {delay:.0f}s")
+            except (TimedOut, NetworkError) as e:
+                if attempt == max_tries - 1:
+                    raise
+                delay = min(2 ** attempt, SEND_MAX_BACKOFF)
+                print(f"Telegram network error ({e}), retrying in {delay}s")
+            time.sleep(delay)
+
+    @staticmethod
+    def _retry_after_seconds(error: RetryAfter) -> float:
+        """Seconds Telegram asked us to wait (int or timedelta by PTB version)."""
+        delay = error.retry_after
+        return delay.total_seconds() if hasattr(delay, 'total_seconds') else float(delay)
+
+    def _run_on_loop(self, coro) -> None:
+        """
+        Run a Bot coroutine on the bot's event loop and wait for it.
+
+        Raises:
+            RuntimeError: If the bot loop is not running
+        """
+        loop = self.loop
+        if not (loop and loop.is_running()):
+            coro.close()
+            raise RuntimeError("Telegram bot loop not available")
+
+        # Called from another thread - schedule on the bot's loop
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        future.result(timeout=SEND_TIMEOUT)
+
+    @staticmethod
+    def _encode_jpeg(frame: np.ndarray) -> Optional[bytes]:
+        """Encode a BGR frame to JPEG bytes, or None on failure."""
+        success, encoded_frame = cv2.imencode(
+            '.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), JPEG_QUALITY]
+        )
+        if not success:
+            print("Error encoding frame to JPEG")
+            return None
+        return encoded_frame.tobytes()
+
+    def send_message(self, text: str) -> bool:
         """
+        Send plain text message.
+
+        Submitted to the bot's long-lived event loop, so every message
+        reuses the same HTTP connection pool.
 
-        # fix
+        Returns:
+            bool: True if the message was sent
+        """
         try:
-            import asyncio
-            loop = self.loop
-            if loop and loop.is_running():
-                # We're in the bot thread - schedule coroutine
-                asyncio.run_coroutine_threadsafe(
-                    self.bot.send_message(chat_id=self.chat_id, text=text),
-                    loop
-                )
-            else:
-                self.logger.error("Telegram bot loop not available")
+            self._send_with_retry(lambda: self.bot.send_message(chat_id=self.chat_id, text=text))
+            return True
         except Exception as e:
             print(f"Error sending message: {e}")
+            return False
 
-    def send_photo(self, frame: np.ndarray, caption: str = "") -> None:
+    def send_photo(self, frame: Union[np.ndarray, bytes], caption: str = "") -> bool:
         """
         Send photo with optional caption.
+
+        Accepts a BGR frame or pre-encoded JPEG bytes (sent as-is).
+
+        Returns:
+            bool: True if the photo was sent
         """
-        # fix
         try:
-            # Convert frame to JPEG
-            success, encoded_frame = cv2.imencode('.jpg', frame)
-            if not success:
-                print("Error encoding frame to JPEG")
-                return
-            
-            # Create BytesIO object
-            bio = io.BytesIO(encoded_frame.tobytes())
-            bio.seek(0)
-            bio.name = 'snapshot.jpg'
-
-            import asyncio
-            loop = self.loop
-            if loop and loop.is_running():
-                # Use run_coroutine_threadsafe to send from different thread
-                asyncio.run_coroutine_threadsafe(
-                    self.bot.send_photo(
-                        chat_id=self.chat_id,
-                        photo=bio,
-                        caption=caption or None
-                    ),
-                    loop
-                )
+            if isinstance(frame, (bytes, bytearray)):
+                jpeg_bytes = bytes(frame)
             else:
-                self.logger.error("Telegram bot loop not available")
+                # Convert frame to JPEG
+                jpeg_bytes = self._encode_jpeg(frame)
+                if jpeg_bytes is None:
+                    return False
+
+            self._send_with_retry(lambda: self.bot.send_photo(
+                chat_id=self.chat_id,
+                photo=jpeg_bytes,
+                caption=caption or None,
+                filename=PHOTO_FILENAME
+            ))
+            return True
         except Exception as e :
             print(f"Error sending photo: {e}")
+            return False
 
     def _is_authorized(self, chat_id: int) -> bool:
         """
@@ -473,6 +788,9 @@ class TelegramBot:
     ) -> None:
         """
         Register callback functions for system control.
+
+        get_snapshot may return a BGR frame or already JPEG-encoded bytes;
+        bytes are forwarded to Telegram without re-encoding.
         """
         self.on_arm_callback = on_arm
         self.on_disarm_callback = on_disarm
@@ -486,34 +804,27 @@ class TelegramBot:
         chat_id = update.effective_chat.id
 
         if not self._is_authorized(chat_id):
-            await update.message.reply_text("⛔ Unauthorized access denied.")
+            await update.message.reply_text(_UNAUTHORIZED_TEXT)
             return
 
         try:
-            from config.settings import settings
-            import socket
-            
             # Get server port
             port = settings.flask_port if hasattr(settings, 'flask_port') else 5001
             
-            # Get local IP address
-            try:
-                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                s.connect(("8.8.8.8", 80))
-                local_ip = s.getsockname()[0]
-                s.close()
-            except:
-                local_ip = "192.168.x.x"
+            # Local IP address cached at start(); retry if no network then
+            if self._local_ip is None:
+                self._local_ip = _discover_local_ip()
+            local_ip = self._local_ip or "192.168.x.x"
             
             # Build URLs
             local_url = f"http://127.0.0.1:{port}"
             network_url = f"http://{local_ip}:{port}"
             
-            # Format message WITHOUT Markdown for URLs
+            # Format message; URLs stay plain text
             message = (
-                "🖥️ *Smart Security Dashboard*\n\n"
+                "🖥️ <b>Smart Security Dashboard</b>\n\n"
                 f"🌐 Local Access:\n"
-                f"{local_url}\n\n"  # Plain URL, no Markdown syntax
+                f"{local_url}\n\n"
                 f"📡 Network Access:\n"
                 f"{network_url}\n\n"
                 f"📊 View live camera feed, detections, and system stats!"
@@ -521,7 +832,7 @@ class TelegramBot:
 
             await update.message.reply_text(
                 message, 
-                parse_mode="Markdown",
+                parse_mode=ParseMode.HTML,
                 disable_web_page_preview=False
             )
 
@@ -534,37 +845,33 @@ class TelegramBot:
         """
         Stop Telegram bot.
         """
-        if self.application and hasattr(self, 'loop'):
+        # Let the alert worker exit
+        try:
+            self._alert_queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+        if self.application and self.loop is not None and self.loop.is_running():
             print("Stopping Telegram bot...")
-            import asyncio
 
-            # Get the event loop for this thread
             try:
-
-                # Schedule stop tasks in the bot's event loop
-                async def shutdown():  
-
-                    # Stop the updater and application
-                    await self.application.updater.stop()
-                    await self.application.stop()
-                    await self.application.shutdown()
-
-                    #Run shutdown in the bot's event loop
-                    future = asyncio.run_coroutine_threadsafe(
-                        shutdown(),
-                        self.loop
-                    )
-
-                    future.result(timeout=10)
-
-                    # Stop the event loop
-                    self.loop.call_soon_threadsafe(self.loop.stop)
-
+                # Shut down on the bot's own loop (running in start()'s thread)
+                future = asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop)
+                future.result(timeout=10)
             except Exception as e:
                 print(f"Error stopping bot: {e}")
+            finally:
+                # Let run_forever() in start() return
+                self.loop.call_soon_threadsafe(self.loop.stop)
 
             print("Telegram bot stopped.")
 
+    async def _shutdown(self) -> None:
+        """Stop polling and shut the application down (runs on the bot loop)."""
+        await self.application.updater.stop()
+        await self.application.stop()
+        await self.application.shutdown()
+
     def __repr__(self) -> str:
         """String representation."""
         return f"<TelegramBot: chat_id={self.chat_id}>"
@@ -37,7 +37,10 @@ Usage:
         system.stop()
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+import os
+import queue
 import threading
 import time
 from enum import Enum
@@ -48,10 +51,11 @@ import sys
 import psutil
 import numpy as np
 import cv2
+import torch
 
 #from src.hardware import PIRSensor, LEDController, Buzzer
 from src.alerts import TelegramBot, AlertManager
-from src.detection import  YOLODetector, DetectionType, AlertLevel # , MotionDetector
+from src.detection import  YOLODetector, DetectionType, AlertLevel, MotionDetector
 from src.streaming import FlaskServer, VideoStreamer
 from src.utils.logger import setup_logger, get_logger
 from src.utils import helpers
@@ -59,6 +63,19 @@ from config.settings import settings
 from src.hardware import Camera 
 
 
+# Seconds between CPU/RAM/temperature samples reported by get_status()
+STATS_SAMPLE_INTERVAL = 1.0
+
+# Seconds between detection statistics log lines (logged by the stats thread)
+DETECTION_STATS_LOG_INTERVAL = 10.0
+
+# Seconds YOLO keeps running after the last motion or PIR trigger
+MOTION_HOLD_SECONDS = 2.0
+
+# JPEG quality of detection snapshots (Q=95 costs ~2x the encode time)
+SNAPSHOT_JPEG_QUALITY = 85
+
+
 class SystemState(Enum):
     """System operational states."""
     DISARMED = "disarmed"
@@ -88,10 +105,12 @@ class SystemManager:
         """
         # Logger
         self.logger = get_logger(__name__)
+        self._logged_errors = set()  # (message, exception type) already logged with traceback
 
         # System state
         self.state = SystemState.DISARMED
         self.start_time = datetime.now()
+        self._start_monotonic = time.monotonic()  # Uptime base, immune to clock jumps
 
         # Hardware components
         self.camera = None
@@ -104,6 +123,10 @@ class SystemManager:
         self.yolo_detector = None
         self.face_detector = None  # For two-stage detection
 
+        # Motion gate: YOLO only runs within MOTION_HOLD_SECONDS of motion
+        self._last_motion_time = 0.0  # time.monotonic() of the last motion
+        self._pir_triggered = threading.Event()
+
         # Alert components
         self.telegram_bot = None
         self.alert_manager = None
@@ -113,13 +136,44 @@ class SystemManager:
         self.video_streamer = None
 
         # Threading
+        self.yolo_thread = None
+        self.yolo_q = queue.Queue()  # (frame or frame list, draw, input tensor(s), Future) inference requests
         self.detection_thread = None
         self.telegram_thread = None
         self.stop_event = threading.Event()
 
-        # Latest annotated frame for streaming
-        self.latest_annotated_frame = None
-        self.frame_lock = threading.Lock()
+        # System stats sampled by a background thread, read by get_status()
+        self.stats_thread = None
+        self._stats_stop = threading.Event()
+        self._cached_cpu = 0.0
+        self._cached_mem = 0.0
+        self._cached_temp = None
+
+        # Latest annotated frame for streaming, in a ring of slots: the
+        # detection thread (the only writer) copies into the next slot and
+        # publishes it with a single reference assignment, so readers get
+        # the published slot without a copy or a lock (also safe on
+        # free-threaded CPython builds). A batch publishes at most
+        # batch_size + 1 frames, so with batch_size + 3 slots a reader's
+        # slot outlives at least one full YOLO pass
+        slot_count = max(1, settings.yolo_batch_size) + 3
+        self._frame_slots = [np.empty((480, 640, 3), dtype=np.uint8) for _ in range(slot_count)]
+        self._publish_count = 0
+        self._front_frame = None
+
+        # Test frame used without a camera: the static background is drawn
+        # once; the timestamp/state overlay is redrawn only when its text
+        # changes, alternating between two buffers so a frame handed out
+        # is not overwritten by the very next redraw
+        self._dummy_bg = self._render_dummy_background()
+        self._dummy_bufs = (np.empty_like(self._dummy_bg), np.empty_like(self._dummy_bg))
+        self._dummy_index = 0
+        self._dummy_text = None
+        self._dummy_lock = threading.Lock()
+
+        # Snapshots are encoded and written off the detection thread
+        self._snapshots_dir = Path("snapshots")  # Created in initialize()
+        self._snapshot_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="Snapshot")
 
         # Snapshot cooldown tracking
         self.last_person_snapshot_time = 0
@@ -158,11 +212,20 @@ class SystemManager:
         """
         try:
             # 1. Setup logger
-            self.logger = get_logger("_name_")
+            self.logger = get_logger(__name__)
             self.logger.info("=" * 60)
             self.logger.info("Initializing Smart Security System...")
             self.logger.info("=" * 60)
 
+            # Capture, detection and streaming each run OpenCV on their own
+            # pinned core; OpenCV's internal pool would only compete with them
+            cv2.setNumThreads(1)
+            self.logger.info(
+                f"Math threads: torch={torch.get_num_threads()}, "
+                f"opencv={cv2.getNumThreads()}, "
+                f"OMP_NUM_THREADS={os.environ.get('OMP_NUM_THREADS', 'unset')}"
+            )
+
             # 2. Initialization camera
             self.logger.info("Initializing camera...")
             self.camera = Camera()
@@ -181,7 +244,18 @@ class SystemManager:
                 self.logger.error("Failed to load YOLO model")
             else:            
                 self.logger.info(f"✓ YOLO detector loaded: {self.yolo_detector}")
+
+                # One worker owns the model; every inference goes through it
+                self.yolo_thread = threading.Thread(
+                    target=self._yolo_worker,
+                    daemon=True,
+                    name="YOLOWorker"
+                )
+                self.yolo_thread.start()
             
+            # Motion detector gates YOLO on static scenes
+            self.motion_detector = MotionDetector()
+
             # Load Face Recognition detector (stage 2: identify authorized persons)
             try:
                 from src.detection.face_recognition_detector import FaceRecognitionDetector
@@ -228,7 +302,19 @@ class SystemManager:
             self.telegram_thread.start()
             self.logger.info("✓ Telegram bot started")
 
-            self.start_time = time.time()
+            # Snapshot directory, created once instead of per snapshot
+            self._snapshots_dir.mkdir(parents=True, exist_ok=True)
+
+            # 8. Sample CPU/RAM/temperature in the background for get_status()
+            self.stats_thread = threading.Thread(
+                target=self._stats_sampler,
+                daemon=True,
+                name="StatsSampler"
+            )
+            self.stats_thread.start()
+
+            self.start_time = datetime.now()
+            self._start_monotonic = time.monotonic()
             self._is_armed = False
 
             # Rate limiting for Face Recognition
@@ -298,7 +384,7 @@ class SystemManager:
             return True
         
         except Exception as e:
-            self.logger.error(f"Failed to arm system: {e}", exc_info=True)
+            self._log_error("Failed to arm system", e)
             return False
 
     def disarm(self) -> bool:
@@ -340,7 +426,7 @@ class SystemManager:
             return True
         
         except Exception as e:
-            self.logger.error(f"Failed to disarm system: {e}", exc_info=True)
+            self._log_error("Failed to disarm system", e)
             return False
             
             
@@ -349,16 +435,38 @@ class SystemManager:
         """
         Main detection loop (runs in separate thread).
         This is the core monitoring loop that processes frames and detects intrusions.
+
+        Frames arrive already gated and preprocessed from _capture_loop,
+        so capture + preprocessing of the next batch overlaps with YOLO
+        and face recognition on the current one.
         """
         self.logger.info("Detection loop started")
+        # Not pinned: threads started from here (face recognition, snapshot
+        # workers) would inherit a single-core affinity mask
 
         # Target FPS for detection (lower than camera FPS)
         detection_fps = 2 # Run detection at 2 fps (reduced for better face recognition accuracy)
         frame_interval = 1.0 / detection_fps
 
+        # Frames run through YOLO together (1 = lowest latency)
+        batch_size = max(1, settings.yolo_batch_size)
+
         consecutive_empty_frames = 0
         max_empty_frames = 10
 
+        # Producer stage: preprocessed batches, newest wins. Input tensor
+        # buffers cycle through input_bufs instead of being reallocated
+        frame_q = queue.Queue(maxsize=2)
+        input_bufs = queue.SimpleQueue()
+        capture_done = threading.Event()
+        capture_thread = threading.Thread(
+            target=self._capture_loop,
+            args=(frame_q, input_bufs, capture_done, batch_size, frame_interval),
+            daemon=True,
+            name="FramePreprocess"
+        )
+        capture_thread.start()
+
         try:
             while not self.stop_event.is_set():
                 # Check if still armed
@@ -368,194 +476,49 @@ class SystemManager:
                     continue
                 loop_start_time = time.time()
 
-                # 1. Get frame from camera
-                frame = None
-                if self.camera and self.camera.is_opened():
-                    frame = self.camera.get_frame(timeout=0.5)
-                
-                # 2. Check frame is valid
-                if frame is None:
+                # 1. Get the next preprocessed batch (paced by _capture_loop)
+                try:
+                    batch, input_buf = frame_q.get(timeout=1.0)
+                except queue.Empty:
+                    continue
+
+                # 2. Check frames are valid
+                if not batch:
+                    input_bufs.put(input_buf)
                     consecutive_empty_frames += 1
                     if consecutive_empty_frames >= max_empty_frames:
                         self.logger.error("To many failed frame reads, stopping detection")
                         break
-                    time.sleep(0.1)
                     continue
                 # Reset empty frame counter 
                 consecutive_empty_frames = 0
 
                 # 3. Two-Stage Detection: YOLO (stage 1) → Face Recognition (stage 2)
-                if self.yolo_detector and self.yolo_detector.model_loaded:
-                    # Run YOLO detection first (without drawing if person might be detected)
-                    detection_result = self.yolo_detector.detect(frame, draw=False)
-
-                    # 4. Process detection results
-                    if detection_result['type'] != DetectionType.NONE:
-                        # STAGE 2: If person detected, check if authorized (Face Recognition)
-                        if detection_result['person_count'] > 0 and self.face_detector:
-                            current_time = time.time()
-
-                            # Determină cooldown-ul bazat pe ultima detecție
-                            if self.last_detection_was_authorized:
-                                cooldown = self.face_recognition_cooldown_authorized  # 5s
-                            else:
-                                cooldown = self.face_recognition_cooldown_unknown  # 1s
-
-                            # Verifică dacă a trecut timpul de cooldown
-                            time_since_last_fr = current_time - self.last_face_recognition_time
-
-                            if time_since_last_fr >= cooldown:
-                                # Rulează Face Recognition
-                                self.logger.info(f"Person detected, running Face Recognition (cooldown: {cooldown}s)")
-                                self.last_face_recognition_time = current_time
-
-                                # Run face recognition in BACKGROUND THREAD (non-blocking)
-                                frame_copy = frame.copy()
-                                frame_id = time.time()
-
-                                def run_face_recognition_async():
-                                    try:
-                                        # Enable drawing to show names and bounding boxes on frame
-                                        face_result = self.face_detector.detect(frame_copy, draw=True)
-
-                                        # Store result with frame_id
-                                        with self.face_recognition_lock:
-                                            self.face_recognition_results[frame_id] = face_result
-
-                                            # Keep only last 5 results (prevent memory leak)
-                                            if len(self.face_recognition_results) > 5:
-                                                oldest_key = min(self.face_recognition_results.keys())
-                                                del self.face_recognition_results[oldest_key]
-
-                                    except Exception as e:
-                                        self.logger.error(f"Face recognition error: {e}")
-
-                                # Start background thread with 3-second timeout
-                                face_thread = threading.Thread(target=run_face_recognition_async, daemon=True)
-                                face_thread.start()
-
-                                # Wait maximum 3 seconds for face recognition result
-                                face_thread.join(timeout=3.0)
-
-                                # Check if result available
-                                with self.face_recognition_lock:
-                                    face_result = self.face_recognition_results.get(frame_id)
-
-                                if face_result:
-                                    # Update annotated frame with face recognition results (always show names)
-                                    face_annotated = face_result.get('frame')
-                                    if face_annotated is not None:
-                                        with self.frame_lock:
-                                            self.latest_annotated_frame = face_annotated
-
-                                    # Check if authorized person detected
-                                    if face_result.get('authorized_person_detected', False):
-                                        authorized_names = face_result.get('authorized_names', [])
-                                        self.last_detection_was_authorized = True  # Marchează pentru viitor
-                                        self.unknown_person_consecutive_count = 0  # Reset counter
-
-                                        # Check each authorized person's session
-                                        should_alert = False
-                                        for person_name in authorized_names:
-                                            if self._update_person_session(person_name, is_authorized=True):
-                                                should_alert = True
-                                                self.logger.info(f"✓ {person_name} detected - sending ONE-TIME alert")
-                                        # If alert needed, modify detection_result for authorized person alert
-                                        if should_alert:
-                                            # Update detection result to send "trusted person" alert
-                                            detection_result['alert_type'] = 'trusted_person'
-                                            detection_result['alert_message'] = f"{', '.join(authorized_names)} (persoană de încredere) detectat"
-                                        else:
-                                            # Alert already sent in this session - skip
-                                            continue
-                                    else:
-                                        # Unknown person detected
-                                        self.last_detection_was_authorized = False  # Marchează pentru viitor
-                                        current_time = time.time()
-
-                                        # Verifică dacă e consecutiv (< 3s de la ultima detecție)
-                                        time_since_last = current_time - self.last_unknown_detection_time
-
-                                        if time_since_last <= self.unknown_confirmation_timeout:
-                                            self.unknown_person_consecutive_count += 1
-                                        else:
-                                            self.unknown_person_consecutive_count = 1  # Reset
-
-                                        self.last_unknown_detection_time = current_time
-
-                                        # Confirmă doar după 2+ detecții consecutive
-                                        if self.unknown_person_consecutive_count >= self.unknown_person_confirmation_threshold:
-                                            if self._update_person_session("Unknown Person", is_authorized=False):
-                                                self.logger.warning(f"⚠ Unknown CONFIRMED ({self.unknown_person_consecutive_count}) - ALERT")
-                                                detection_result['alert_type'] = 'unknown_person'
-                                                detection_result['alert_message'] = "Persoana necunoscuta detectata"
-                                            else:
-                                                continue
-                                        else:
-                                            self.logger.debug(f"Unknown not confirmed ({self.unknown_person_consecutive_count}/2)")
-                                            continue
-                                else:
-                                    # Face recognition timeout - draw YOLO results manually
-                                    self.logger.warning("Face recognition timeout or failed - using YOLO detection only")
-                                    yolo_annotated = self._draw_yolo_detections(frame.copy(), detection_result)
-                                    with self.frame_lock:
-                                        self.latest_annotated_frame = yolo_annotated
-
-                                    # Skip alert when face recognition fails
-                                    self.logger.info("Skipping alert due to face recognition timeout (no identification made)")
-                                    continue
-                            else:
-                                # Skip Face Recognition, folosește ultimul frame annotat
-                                self.logger.debug(f"Skipping Face Recognition (cooldown: {time_since_last_fr:.1f}/{cooldown}s)")
-                                # Continuă cu ultimul frame annotat, nu face nimic
-                                continue
-
-                        # Process detection (triggers alert if not authorized)
-                        self._process_detection(frame, detection_result)
+                moving_frames = []
+                static_frame = None
+                for frame, moving in batch:
+                    if moving:
+                        moving_frames.append(frame)
                     else:
-                        # No person detected, but maybe animals - draw YOLO results
-                        if detection_result['animal_count'] > 0:
-                            yolo_annotated = self._draw_yolo_detections(frame.copy(), detection_result)
-                            with self.frame_lock:
-                                self.latest_annotated_frame = yolo_annotated
+                        static_frame = frame
 
-                            # Verifică rate limiting pentru animal alerts
-                            current_time = time.time()
-                            time_since_last_animal_alert = current_time - self.last_animal_alert_time
+                if static_frame is not None:
+                    # Static scene - skip YOLO and show the latest clean frame
+                    self._publish_frame(static_frame)
 
-                            if time_since_last_animal_alert >= self.animal_alert_cooldown:
-                                # Trimite alertă LOW pentru animale
-                                animal_types = set([d['class_name'] for d in detection_result['detections']
-                                                  if d['classification'] == 'animal'])
+                detection_results = []
+                if moving_frames and self.yolo_detector and self.yolo_detector.model_loaded:
+                    # Run YOLO on the whole batch at once (without drawing);
+                    # moving frames fill the first rows of input_buf
+                    detection_results = self.submit_detection_batch(
+                        moving_frames, input_tensors=input_buf[:len(moving_frames)]
+                    ).result()
+                input_bufs.put(input_buf)
 
-                                detection_result['alert_type'] = 'animal_detected'
-                                detection_result['alert_message'] = f"Animal detectat: {', '.join(animal_types)}"
+                # 4. Process detection results
+                for frame, detection_result in zip(moving_frames, detection_results):
+                    self._handle_detection(frame, detection_result)
 
-                                self.last_animal_alert_time = current_time
-                                self._process_detection(frame, detection_result)
-                            else:
-                                # Cooldown activ - nu trimite alertă
-                                self.logger.debug(f"Animal alert cooldown ({time_since_last_animal_alert:.0f}s / 60s)")
-                        else:
-                            # No detections at all - show clean frame
-                            with self.frame_lock:
-                                self.latest_annotated_frame = frame
-
-                # 5. Control loop rate
-                elapsed = time.time() - loop_start_time
-                sleep_time = frame_interval - elapsed
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-                
-                # Log performance
-                if self.yolo_detector.inference_count % 50 == 0 and self.yolo_detector.inference_count > 0:
-                    stats = self.yolo_detector.get_statistics()
-                    self.logger.info(
-                    f"Detection stats: {stats['inference_count']} inferences, "
-                    f"{stats['person_detections']} persons, "
-                    f"{stats['animal_detections']} animals"
-                )
-                
                 # Cleanup old sessino periodically
                 self._cleanup_old_sessions()
 
@@ -567,8 +530,310 @@ class SystemManager:
             self.logger.error(f"Error in detection loop: {e}", exc_info=True)
         
         finally:
+            capture_done.set()
+            capture_thread.join(timeout=2.0)
             self.logger.info("Detection loop stopped")
 
+    def _capture_loop(
+        self,
+        frame_q: queue.Queue,
+        input_bufs: queue.SimpleQueue,
+        done: threading.Event,
+        batch_size: int,
+        frame_interval: float
+    ) -> None:
+        """
+        Capture, motion-gate and preprocess frames for _detection_loop (runs in thread).
+
+        Every frame_interval, puts (batch, input_buf) on frame_q: batch is a
+        list of (frame, moving) pairs, and the moving frames' input tensors
+        fill the first rows of input_buf, a float32
+        (batch_size, 3, img_size, img_size) buffer taken from input_bufs
+        (the consumer hands it back). An empty batch reports a failed
+        camera read. When the queue is full the oldest batch is dropped.
+        """
+        helpers.pin_current_thread(helpers.CAPTURE_CORE)
+        img_size = self.yolo_detector.img_size
+
+        while not done.is_set() and not self.stop_event.is_set():
+            if self.state != SystemState.ARMED and self.state != SystemState.ALARM:
+                time.sleep(1)
+                continue
+            loop_start_time = time.time()
+
+            try:
+                input_buf = input_bufs.get_nowait()
+            except queue.Empty:
+                input_buf = np.empty((batch_size, 3, img_size, img_size), dtype=np.float32)
+
+            try:
+                # Only frames that pass the motion gate are preprocessed
+                batch = []
+                row = 0
+                for frame in self._collect_frames(batch_size, frame_interval):
+                    moving = self._motion_gate(frame)
+                    if moving:
+                        self.yolo_detector.preprocess(frame, out=input_buf[row:row + 1])
+                        row += 1
+                    batch.append((frame, moving))
+            except Exception as e:
+                self._log_error("Error preprocessing frames", e)
+                batch = []
+
+            try:
+                frame_q.put_nowait((batch, input_buf))
+            except queue.Full:
+                try:
+                    _, dropped_buf = frame_q.get_nowait()
+                    input_bufs.put(dropped_buf)
+                except queue.Empty:
+                    pass
+                frame_q.put_nowait((batch, input_buf))
+
+            # Control loop rate
+            if not batch:
+                time.sleep(0.1)
+                continue
+            sleep_time = frame_interval - (time.time() - loop_start_time)
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+
+    def _collect_frames(self, batch_size: int, max_wait: float) -> list:
+        """
+        Read up to batch_size camera frames, spending at most max_wait seconds.
+
+        The first read waits up to 0.5s as before; further frames are only
+        read while time remains, so batch_size=1 reads a single frame.
+        """
+        frames = []
+        if not (self.camera and self.camera.is_opened()):
+            return frames
+
+        deadline = time.monotonic() + max_wait
+        frame = self.camera.get_frame(timeout=0.5)
+        while frame is not None:
+            frames.append(frame)
+            remaining = deadline - time.monotonic()
+            if len(frames) >= batch_size or remaining <= 0:
+                break
+            frame = self.camera.get_frame(timeout=remaining)
+
+        return frames
+
+    def _handle_detection(self, frame: np.ndarray, detection_result: dict) -> None:
+        """
+        Act on one YOLO result: face recognition, annotation and alerts.
+        """
+        if detection_result['type'] != DetectionType.NONE:
+            # STAGE 2: If person detected, check if authorized (Face Recognition)
+            if detection_result['person_count'] > 0 and self.face_detector:
+                current_time = time.time()
+
+                # Determină cooldown-ul bazat pe ultima detecție
+                if self.last_detection_was_authorized:
+                    cooldown = self.face_recognition_cooldown_authorized  # 5s
+                else:
+                    cooldown = self.face_recognition_cooldown_unknown  # 1s
+
+                # Verifică dacă a trecut timpul de cooldown
+                time_since_last_fr = current_time - self.last_face_recognition_time
+
+                if time_since_last_fr >= cooldown:
+                    # Rulează Face Recognition
+                    self.logger.info(f"Person detected, running Face Recognition (cooldown: {cooldown}s)")
+                    self.last_face_recognition_time = current_time
+
+                    # Run face recognition in BACKGROUND THREAD (non-blocking)
+                    frame_copy = frame.copy()
+                    frame_id = time.time()
+
+                    def run_face_recognition_async():
+                        try:
+                            # Enable drawing to show names and bounding boxes on frame
+                            face_result = self.face_detector.detect(frame_copy, draw=True)
+
+                            # Store result with frame_id
+                            with self.face_recognition_lock:
+                                self.face_recognition_results[frame_id] = face_result
+
+                                # Keep only last 5 results (prevent memory leak)
+                                if len(self.face_recognition_results) > 5:
+                                    oldest_key = min(self.face_recognition_results.keys())
+                                    del self.face_recognition_results[oldest_key]
+
+                        except Exception as e:
+                            self.logger.error(f"Face recognition error: {e}")
+
+                    # Start background thread with 3-second timeout
+                    face_thread = threading.Thread(target=run_face_recognition_async, daemon=True)
+                    face_thread.start()
+
+                    # Wait maximum 3 seconds for face recognition result
+                    face_thread.join(timeout=3.0)
+
+                    # Check if result available
+                    with self.face_recognition_lock:
+                        face_result = self.face_recognition_results.get(frame_id)
+
+                    if face_result:
+                        # Update annotated frame with face recognition results (always show names)
+                        face_annotated = face_result.get('frame')
+                        if face_annotated is not None:
+                            self._publish_frame(face_annotated)
+
+                        # Check if authorized person detected
+                        if face_result.get('authorized_person_detected', False):
+                            authorized_names = face_result.get('authorized_names', [])
+                            self.last_detection_was_authorized = True  # Marchează pentru viitor
+                            self.unknown_person_consecutive_count = 0  # Reset counter
+
+                            # Check each authorized person's session
+                            should_alert = False
+                            for person_name in authorized_names:
+                                if self._update_person_session(person_name, is_authorized=True):
+                                    should_alert = True
+                                    self.logger.info(f"✓ {person_name} detected - sending ONE-TIME alert")
+                            # If alert needed, modify detection_result for authorized person alert
+                            if should_alert:
+                                # Update detection result to send "trusted person" alert
+                                detection_result['alert_type'] = 'trusted_person'
+                                detection_result['alert_message'] = f"{', '.join(authorized_names)} (persoană de încredere) detectat"
+                            else:
+                                # Alert already sent in this session - skip
+                                return
+                        else:
+                            # Unknown person detected
+                            self.last_detection_was_authorized = False  # Marchează pentru viitor
+                            current_time = time.time()
+
+                            # Verifică dacă e consecutiv (< 3s de la ultima detecție)
+                            time_since_last = current_time - self.last_unknown_detection_time
+
+                            if time_since_last <= self.unknown_confirmation_timeout:
+                                self.unknown_person_consecutive_count += 1
+                            else:
+                                self.unknown_person_consecutive_count = 1  # Reset
+
+                            self.last_unknown_detection_time = current_time
+
+                            # Confirmă doar după 2+ detecții consecutive
+                            if self.unknown_person_consecutive_count >= self.unknown_person_confirmation_threshold:
+                                if self._update_person_session("Unknown Person", is_authorized=False):
+                                    self.logger.warning(f"⚠ Unknown CONFIRMED ({self.unknown_person_consecutive_count}) - ALERT")
+                                    detection_result['alert_type'] = 'unknown_person'
+                                    detection_result['alert_message'] = "Persoana necunoscuta detectata"
+                                else:
+                                    return
+                            else:
+                                self.logger.debug(f"Unknown not confirmed ({self.unknown_person_consecutive_count}/2)")
+                                return
+                    else:
+                        # Face recognition timeout - draw YOLO results manually
+                        self.logger.warning("Face recognition timeout or failed - using YOLO detection only")
+                        yolo_annotated = self._draw_yolo_detections(frame.copy(), detection_result)
+                        self._publish_frame(yolo_annotated)
+
+                        # Skip alert when face recognition fails
+                        self.logger.info("Skipping alert due to face recognition timeout (no identification made)")
+                        return
+                else:
+                    # Skip Face Recognition, folosește ultimul frame annotat
+                    self.logger.debug(f"Skipping Face Recognition (cooldown: {time_since_last_fr:.1f}/{cooldown}s)")
+                    # Continuă cu ultimul frame annotat, nu face nimic
+                    return
+
+            # Process detection (triggers alert if not authorized)
+            self._process_detection(frame, detection_result)
+        else:
+            # No person detected, but maybe animals - draw YOLO results
+            if detection_result['animal_count'] > 0:
+                yolo_annotated = self._draw_yolo_detections(frame.copy(), detection_result)
+                self._publish_frame(yolo_annotated)
+
+                # Verifică rate limiting pentru animal alerts
+                current_time = time.time()
+                time_since_last_animal_alert = current_time - self.last_animal_alert_time
+
+                if time_since_last_animal_alert >= self.animal_alert_cooldown:
+                    # Trimite alertă LOW pentru animale
+                    animal_types = set([d['class_name'] for d in detection_result['detections']
+                                      if d['classification'] == 'animal'])
+
+                    detection_result['alert_type'] = 'animal_detected'
+                    detection_result['alert_message'] = f"Animal detectat: {', '.join(animal_types)}"
+
+                    self.last_animal_alert_time = current_time
+                    self._process_detection(frame, detection_result)
+                else:
+                    # Cooldown activ - nu trimite alertă
+                    self.logger.debug(f"Animal alert cooldown ({time_since_last_animal_alert:.0f}s / 60s)")
+            else:
+                # No detections at all - show clean frame
+                self._publish_frame(frame)
+
+    def _yolo_worker(self) -> None:
+        """
+        Run all YOLO inference requests (runs in thread).
+
+        A single thread owns the model, so callers from any thread never
+        run inference concurrently or need their own model copy.
+        Not pinned: torch creates its intra-op (OpenMP) pool from this
+        thread, and the pool threads would inherit a single-core mask.
+        """
+
+        while True:
+            request = self.yolo_q.get()
+            if request is None:
+                break
+
+            frame, draw, input_tensor, future = request
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if isinstance(frame, list):
+                    future.set_result(self.yolo_detector.detect_batch(frame, draw=draw, input_tensors=input_tensor))
+                else:
+                    future.set_result(self.yolo_detector.detect(frame, draw=draw, input_tensor=input_tensor))
+            except Exception as e:
+                future.set_exception(e)
+
+    def submit_detection(
+        self,
+        frame: np.ndarray,
+        draw: bool = False,
+        input_tensor: Optional[np.ndarray] = None
+    ) -> Future:
+        """
+        Queue a frame for YOLO inference on the worker thread.
+
+        Args:
+            input_tensor: YOLODetector.preprocess(frame), if already computed
+
+        Returns:
+            Future: Resolves to the YOLODetector.detect() result dict
+        """
+        future = Future()
+        self.yolo_q.put((frame, draw, input_tensor, future))
+        return future
+
+    def submit_detection_batch(
+        self,
+        frames: list,
+        draw: bool = False,
+        input_tensors: Optional[list] = None
+    ) -> Future:
+        """
+        Queue several frames for one batched YOLO pass on the worker thread.
+
+        Args:
+            input_tensors: YOLODetector.preprocess() of each frame, if already computed
+
+        Returns:
+            Future: Resolves to a list of YOLODetector.detect() result dicts
+        """
+        future = Future()
+        self.yolo_q.put((frames, draw, input_tensors, future))
+        return future
 
     def _handle_pir_trigger(self, channel: int) -> None:
         """
@@ -576,15 +841,29 @@ class SystemManager:
 
         Args:
             channel: GPIO pin that triggered
+        """
+        self.logger.debug(f"PIR triggered on channel {channel}")
+        if self.state == SystemState.ARMED or self.state == SystemState.ALARM:
+            # Picked up by _motion_gate() on the next detection frame
+            self._pir_triggered.set()
 
-        TODO:
-        - Log PIR trigger
-        - If system is ARMED:
-            - Set flag to start motion detection
-            - Optional: Brief buzzer beep as feedback
+    def _motion_gate(self, frame: np.ndarray) -> bool:
         """
-        # TODO: Implement PIR callback
-        pass
+        Decide whether YOLO should run on this frame.
+
+        True within MOTION_HOLD_SECONDS of the last PIR trigger or
+        camera motion, and always when no motion detector is available.
+        """
+        if self.motion_detector is None:
+            return True
+
+        # Check every frame (even while YOLO runs) so the reference stays current
+        now = time.monotonic()
+        if self.motion_detector.has_motion(frame) or self._pir_triggered.is_set():
+            self._pir_triggered.clear()
+            self._last_motion_time = now
+
+        return (now - self._last_motion_time) < MOTION_HOLD_SECONDS
 
     def _process_detection(
         self,
@@ -632,28 +911,12 @@ class SystemManager:
                 current_time = time.time()
                 if current_time - self.last_person_snapshot_time >= self.snapshot_cooldown:
                     frame_copy = frame.copy()  # Prevent race conditions
-                    self.last_person_snapshot_time = current_time  # Update BEFORE thread starts
-                    
-                    def save_snapshot_async():
-                        nonlocal snapshot_path
-                        try:
-                            from pathlib import Path
-                            from datetime import datetime
+                    self.last_person_snapshot_time = current_time
 
-                            Path("snapshots").mkdir(parents=True, exist_ok=True)
+                    snapshot_path = self._snap_path("snapshot")
 
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
-                            filename = f"snapshot_{timestamp}.jpg"
-                            snapshot_path = f"snapshots/{filename}"
-
-                            cv2.imwrite(snapshot_path, frame_copy, [cv2.IMWRITE_JPEG_QUALITY, 95])
-                            self.logger.info(f"Snapshot saved: {snapshot_path}")
-
-                        except Exception as e:
-                            self.logger.error(f"Failed to save snapshot: {e}")
-                    
-                    # Run in background thread
-                    threading.Thread(target=save_snapshot_async, daemon=True).start()
+                    # Encode + write on the snapshot pool
+                    self._save_snapshot_async(frame_copy, snapshot_path)
                 else:
                     # Skip snapshot due to cooldown
                     remaining = self.snapshot_cooldown - (current_time - self.last_person_snapshot_time)
@@ -700,28 +963,12 @@ class SystemManager:
                 animal_cooldown = self.snapshot_cooldown * 3  # 30 seconds for animals
                 if current_time - self.last_animal_snapshot_time >= animal_cooldown:
                     frame_copy = frame.copy()  # Prevent race conditions
-                    self.last_animal_snapshot_time = current_time  # Update BEFORE thread starts
+                    self.last_animal_snapshot_time = current_time
 
-                    def save_animal_snapshot_async():
-                        nonlocal snapshot_path
-                        try:
-                            from pathlib import Path
-                            from datetime import datetime
-
-                            Path("snapshots").mkdir(parents=True, exist_ok=True)
-
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
-                            filename = f"snapshot_animal_{timestamp}.jpg"
-                            snapshot_path = f"snapshots/{filename}"
-
-                            cv2.imwrite(snapshot_path, frame_copy, [cv2.IMWRITE_JPEG_QUALITY, 95])
-                            self.logger.info(f"Animal snapshot saved: {snapshot_path}")
+                    snapshot_path = self._snap_path("snapshot_animal")
 
-                        except Exception as e:
-                            self.logger.error(f"Failed to save snapshot: {e}")
-
-                    # Run in background thread
-                    threading.Thread(target=save_animal_snapshot_async, daemon=True).start()
+                    # Encode + write on the snapshot pool
+                    self._save_snapshot_async(frame_copy, snapshot_path)
                 else:
                     remaining = animal_cooldown - (current_time - self.last_animal_snapshot_time)
                     self.logger.debug(f"Animal snapshot skipped (cooldown: {remaining:.1f}s remaining)")
@@ -735,7 +982,37 @@ class SystemManager:
                         alert_type='low'
                     )
         except Exception as e:
-            self.logger.error(f"Error processing detection: {e}", exc_info=True)
+            self._log_error("Error processing detection", e)
+
+    def _snap_path(self, prefix: str) -> Path:
+        """
+        Build a unique snapshot file path: snapshots/<prefix>_<time_ns>.jpg
+        """
+        return self._snapshots_dir / f"{prefix}_{time.time_ns()}.jpg"
+
+    def _save_snapshot_async(self, frame: np.ndarray, path: Path) -> None:
+        """
+        Queue a snapshot to be JPEG-encoded and written on the snapshot pool.
+
+        Args:
+            frame: Private copy of the frame (not reused by the caller)
+            path: Destination file path
+        """
+        self._snapshot_pool.submit(self._write_snapshot, frame, path)
+
+    def _write_snapshot(self, frame: np.ndarray, path: Path) -> None:
+        """
+        Encode and write one snapshot (runs on the snapshot pool).
+        """
+        try:
+            jpeg = helpers.convert_to_jpeg(frame, quality=SNAPSHOT_JPEG_QUALITY)
+            with open(path, 'wb') as f:
+                f.write(jpeg)
+
+            self.logger.info(f"Snapshot saved: {path}")
+
+        except Exception as e:
+            self.logger.error(f"Failed to save snapshot: {e}")
 
     def _draw_yolo_detections(self, frame: np.ndarray, detection_result: Dict) -> np.ndarray:
         """
@@ -869,16 +1146,48 @@ class SystemManager:
             self.logger.debug(f"Cleaned up expired session for {person_name}")
         
 
+    def _stats_sampler(self) -> None:
+        """
+        Refresh cached CPU/RAM/temperature readings (runs in thread).
+
+        get_status() is polled by the dashboard and Telegram; reading the
+        cached values keeps it constant-time regardless of poll rate.
+
+        Also logs YOLO detection statistics every
+        DETECTION_STATS_LOG_INTERVAL seconds when new inferences ran, so
+        the detection loop does no logging of its own.
+        """
+        psutil.cpu_percent(interval=None)  # Prime the CPU counters
+        last_stats_log = time.monotonic()
+        logged_inferences = 0
+        while not self._stats_stop.wait(STATS_SAMPLE_INTERVAL):
+            try:
+                self._cached_cpu = psutil.cpu_percent(interval=None)
+                self._cached_mem = psutil.virtual_memory().percent
+                self._cached_temp = helpers.get_cpu_temperature()
+
+                now = time.monotonic()
+                if self.yolo_detector and now - last_stats_log >= DETECTION_STATS_LOG_INTERVAL:
+                    last_stats_log = now
+                    stats = self.yolo_detector.get_statistics()
+                    if stats['inference_count'] != logged_inferences:
+                        logged_inferences = stats['inference_count']
+                        self.logger.info(
+                            "Detection stats: %d inferences, %d persons, %d animals",
+                            stats['inference_count'],
+                            stats['person_detections'],
+                            stats['animal_detections']
+                        )
+            except Exception as e:
+                self.logger.error(f"Error sampling system stats: {e}")
+
     def get_status(self) -> dict:
         """Get current system status with proper format for dashboard."""
-        from src.utils.helpers import get_cpu_usage, get_memory_usage, get_cpu_temperature
-        import time
-
         # Calculate uptime in SECONDS (not formatted)
-        uptime_seconds = time.time() - self.start_time if hasattr(self, 'start_time') and isinstance(self.start_time, (int, float)) else 0
+        uptime_seconds = self.get_uptime()
 
-        # Get CPU temperature (handle None on Mac)
-        cpu_temp = get_cpu_temperature()
+        # CPU temperature sampled by _stats_sampler (None on Mac)
+        cpu_temp = self._cached_temp
 
         # Calculate actual camera FPS
         camera_fps = 0.0
@@ -892,8 +1201,8 @@ class SystemManager:
             "state": self.state.value if hasattr(self, 'state') else "disarmed",
 
             # Numeric values, not formatted strings
-            "cpu_usage": round(get_cpu_usage(), 1),
-            "ram_usage": round(get_memory_usage(), 1),
+            "cpu_usage": round(self._cached_cpu, 1),
+            "ram_usage": round(self._cached_mem, 1),
             "temperature": round(cpu_temp, 1) if cpu_temp is not None else None,
 
             # CRITICAL: Send uptime as NUMBER (seconds), not formatted string
@@ -914,16 +1223,48 @@ class SystemManager:
         }
         return status
 
+    def _publish_frame(self, frame: np.ndarray) -> None:
+        """
+        Hand an annotated frame to get_current_frame().
+
+        Copies into the next slot (reallocated if the frame size
+        changed), then publishes it. Must only be called from the
+        detection thread.
+        """
+        next_idx = (self._publish_count + 1) % len(self._frame_slots)
+        slot = self._frame_slots[next_idx]
+        if slot.shape != frame.shape or slot.dtype != frame.dtype:
+            slot = self._frame_slots[next_idx] = np.empty_like(frame)
+        np.copyto(slot, frame)
+
+        self._publish_count += 1
+        self._front_frame = slot
+
+    def _log_error(self, message: str, error: Exception) -> None:
+        """
+        Log an error, with its traceback only the first time it occurs.
+
+        Repeats of the same message and exception type are logged
+        without exc_info, so a transient error that keeps recurring does
+        not format a full traceback every time.
+        """
+        key = (message, type(error))
+        first = key not in self._logged_errors
+        self._logged_errors.add(key)
+        self.logger.error("%s: %s", message, error, exc_info=first)
+
     def get_current_frame(self):
         """
         Get current camera frame (for snapshots/streaming).
         Returns annotated frame with detections if available, otherwise raw camera frame.
+
+        The annotated frame is a shared buffer: treat it as read-only.
         """
         # Try to return annotated frame first (with YOLO detections)
         if self.state == SystemState.ARMED or self.state == SystemState.ALARM:
-            with self.frame_lock:
-                if self.latest_annotated_frame is not None:
-                    return self.latest_annotated_frame.copy()
+            frame = self._front_frame
+            if frame is not None:
+                return frame
 
         # Fallback to raw camera frame
         if self.camera and self.camera.is_opened():
@@ -939,45 +1280,70 @@ class SystemManager:
         Get current camera snapshot for Telegram bot.
         Returns the current frame (with detections if armed).
 
+        Off the streaming hot path, so it returns a private copy. The
+        copy is retried if the detection thread got around to rewriting
+        the slot while it was being made.
+
         Returns:
             np.ndarray: Current camera frame
         """
-        return self.get_current_frame()
+        while True:
+            count = self._publish_count
+            frame = self.get_current_frame().copy()
+            if self._publish_count - count < len(self._frame_slots) - 1:
+                return frame
         
 
+    @staticmethod
+    def _render_dummy_background() -> np.ndarray:
+        """Render the static part of the test frame (background + title)."""
+        # Orange 640x480 frame (BGR format: Blue, Green, Red)
+        frame = np.full((480, 640, 3), (60, 120, 180), dtype=np.uint8)
+
+        # Title
+        cv2.putText(frame, "TEST MODE - NO CAMERA", (140, 180),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.9, (255, 255, 255), 2, cv2.LINE_AA)
+
+        return frame
+
     def _generate_dummy_frame(self) -> np.ndarray:
         """
         Generate colored test frame with system info (for testing without camera).
-        
+
+        The returned array is shared and reused; callers must not modify it.
+
         Returns:
             np.ndarray: 640x480 BGR frame with text overlay
         """
-        # Create blank frame (480 height x 640 width x 3 color channels)
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        
-        # Fill with orange color (BGR format: Blue, Green, Red)
-        frame[:] = (60, 120, 180)  
-        
-        # Add text overlays
-        font = cv2.FONT_HERSHEY_SIMPLEX
-        white = (255, 255, 255)
-        
-        # Title
-        cv2.putText(frame, "TEST MODE - NO CAMERA", (140, 180), 
-                    font, 0.9, white, 2, cv2.LINE_AA)
-        
-        # Current timestamp
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        cv2.putText(frame, timestamp, (200, 240), 
-                    font, 0.7, white, 2, cv2.LINE_AA)
-        
-        # System state
-        state_text = f"State: {self.state.value.upper()}"
-        state_color = (0, 255, 0) if self.state == SystemState.ARMED else (100, 100, 100)
-        cv2.putText(frame, state_text, (230, 300), 
-                    font, 0.8, state_color, 2, cv2.LINE_AA)
-        
-        return frame
+        state = self.state
+
+        with self._dummy_lock:
+            # Text unchanged (same second, same state) - reuse last frame
+            if self._dummy_text == (timestamp, state):
+                return self._dummy_bufs[self._dummy_index]
+
+            self._dummy_index ^= 1
+            frame = self._dummy_bufs[self._dummy_index]
+            np.copyto(frame, self._dummy_bg)
+
+            # Positions are fixed (no getTextSize); LINE_8 skips the
+            # anti-aliasing pass for the per-second overlay
+            font = cv2.FONT_HERSHEY_SIMPLEX
+            white = (255, 255, 255)
+
+            # Current timestamp
+            cv2.putText(frame, timestamp, (200, 240),
+                        font, 0.7, white, 2, cv2.LINE_8)
+
+            # System state
+            state_text = f"State: {state.value.upper()}"
+            state_color = (0, 255, 0) if state == SystemState.ARMED else (100, 100, 100)
+            cv2.putText(frame, state_text, (230, 300),
+                        font, 0.8, state_color, 2, cv2.LINE_8)
+
+            self._dummy_text = (timestamp, state)
+            return frame
 
 
     def trigger_alarm(self) -> None:
@@ -1000,7 +1366,7 @@ class SystemManager:
             self.logger.info("Alarm activated: LEDs and buzzer triggered")
 
         except Exception as e:
-            self.logger.error(f"Error triggering alarm: {e}", exc_info=True)
+            self._log_error("Error triggering alarm", e)
 
     def clear_alarm(self) -> None:
         """
@@ -1022,7 +1388,7 @@ class SystemManager:
             self.logger.info("Alarm cleared: LEDs and buzzer deactivated")
 
         except Exception as e:
-            self.logger.error(f"Error clearing alarm: {e}", exc_info=True)
+            self._log_error("Error clearing alarm", e)
 
     def stop(self) -> None:
         """
@@ -1055,6 +1421,12 @@ class SystemManager:
             self.stop_event.set()
             self.detection_thread.join(timeout=5)
 
+        # Stop stats sampler
+        self._stats_stop.set()
+
+        # Finish writing queued snapshots
+        self._snapshot_pool.shutdown(wait=True)
+
         # Stop Flask server
         if self.flask_server:
             self.logger.info("Stopping Flask server...")
@@ -1071,6 +1443,9 @@ class SystemManager:
         # Stop YOLO detector
         if self.yolo_detector:
             self.logger.info("Stopping YOLO detector...")
+            self.yolo_q.put(None)
+            if self.yolo_thread and self.yolo_thread.is_alive():
+                self.yolo_thread.join(timeout=5)
             stats = self.yolo_detector.get_statistics()
             self.logger.info(f"Detection statistics: {stats}")
 
@@ -1140,7 +1515,7 @@ class SystemManager:
 
     def get_uptime(self) -> float:
         """Get system uptime in seconds."""
-        return (datetime.now() - self.start_time).total_seconds()
+        return time.monotonic() - self._start_monotonic
 
 
 if __name__ == "__main__":
@@ -1148,6 +1523,7 @@ if __name__ == "__main__":
     print("System Manager test - TODO: Implement test code")
     print("Testing get_current_frame()...")
     import sys
+    import tempfile
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
     from src.utils.logger import setup_logger, get_logger
 
@@ -1157,8 +1533,14 @@ if __name__ == "__main__":
     frame = manager.get_current_frame()
     if frame is not None:
         print("Frame retrieved successfully.")
-        cv2.imshow("Test Frame", frame)
-        cv2.waitKey(2000)  # Display for 2 seconds
-        cv2.destroyAllWindows()
+        if os.environ.get("DISPLAY"):
+            cv2.imshow("Test Frame", frame)
+            cv2.waitKey(2000)  # Display for 2 seconds
+            cv2.destroyAllWindows()
+        else:
+            # Headless (CI, Pi over SSH): imshow would fail, save instead
+            out_path = os.path.join(tempfile.gettempdir(), "test_frame.jpg")
+            cv2.imwrite(out_path, frame)
+            print(f"No display, frame saved to {out_path}")
     else:
         print("Failed to retrieve frame.")
@@ -0,0 +1,268 @@
+"""
+Face Database Module - Known Faces Storage
+
+Stores the known faces database as a single NumPy archive with a
+structure-of-arrays layout:
+- encodings: float32 matrix of shape (N, 128), one row per face sample
+- names: unicode array of length N, the person each row belongs to
+
+Matching a face against the whole database is then one vectorized
+distance computation instead of a Python loop over persons.
+
+Each save also stores a per-person summary: the mean encoding
+(centroid) and the largest Euclidean distance of that person's samples
+from it (radius). By the triangle inequality, a face farther than
+radius + tolerance from a centroid cannot match any of that person's
+samples, so recognition checks one vector per person first and only
+compares the samples of the persons that remain.
+
+Optionally the encodings can be stored int8 scalar-quantized (one
+float32 scale per row), a quarter of the float32 size on disk. They are
+dequantized back to float32 on load.
+
+Databases written by older versions (a pickled {name: [encodings]} dict,
+by default at database.pkl) are converted once, the first time they are
+loaded; after that the database is read with pickle disabled. A pickle
+converted in place is kept as <name>.bak.
+
+Usage:
+    from src.detection.face_database import load_face_database, save_face_database
+
+    encodings, names = load_face_database("data/known_faces/database.npz")
+    save_face_database("data/known_faces/database.npz", encodings, names)
+"""
+
+import os
+import pickle
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Length of a face_recognition (dlib ResNet) face encoding
+ENCODING_SIZE = 128
+
+# Supported on-disk quantization modes for save_face_database()
+QUANTIZE_MODES = ("int8",)
+
+# Distance the stored centroid radii are measured in (older files used cosine)
+CENTROID_METRIC = "euclidean"
+
+# np.savez writes a zip archive
+_ZIP_MAGIC = b"PK\x03\x04"
+
+
+def empty_database() -> Tuple[np.ndarray, np.ndarray]:
+    """Return an empty (encodings, names) pair."""
+    return np.empty((0, ENCODING_SIZE), dtype=np.float32), np.empty(0, dtype=str)
+
+
+def from_dict(database: Dict[str, List[np.ndarray]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten a {name: [encodings]} dict into (encodings, names) arrays.
+
+    Args:
+        database: Mapping of person name to their face encodings
+
+    Returns:
+        Tuple of float32 (N, 128) encodings and length-N names
+    """
+    rows = [enc for person_encodings in database.values() for enc in person_encodings]
+    if not rows:
+        return empty_database()
+
+    encodings = np.asarray(rows, dtype=np.float32).reshape(-1, ENCODING_SIZE)
+    names = np.array([name for name, person_encodings in database.items() for _ in person_encodings])
+    return encodings, names
+
+
+def to_dict(encodings: np.ndarray, names: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Group (encodings, names) arrays back into a {name: encodings} dict.
+
+    Persons keep the order in which they first appear.
+    """
+    return {str(name): encodings[names == name] for name in dict.fromkeys(names.tolist())}
+
+
+def compute_centroids(
+    encodings: np.ndarray,
+    names: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reduce per-sample encodings to one centroid and radius per person.
+
+    Args:
+        encodings: (N, 128) face encodings
+        names: Length-N person names
+
+    Returns:
+        Tuple of (person names (P,), float32 centroids (P, 128),
+        float32 radii (P,)) where radius is the max Euclidean distance
+        of a sample from its person's centroid
+    """
+    persons = np.array(list(dict.fromkeys(names.tolist())), dtype=str)
+    centroids = np.empty((len(persons), ENCODING_SIZE), dtype=np.float32)
+    radii = np.empty(len(persons), dtype=np.float32)
+
+    for i, person in enumerate(persons):
+        samples = encodings[names == person]
+        mean = samples.mean(axis=0)
+        centroids[i] = mean
+        radii[i] = float(np.max(np.linalg.norm(samples - mean, axis=1)))
+
+    return persons, centroids, radii
+
+
+def _is_npz(db_file: Path) -> bool:
+    """Check whether a file is a NumPy .npz (zip) archive."""
+    with open(db_file, 'rb') as f:
+        return f.read(len(_ZIP_MAGIC)) == _ZIP_MAGIC
+
+
+def migrate_legacy_database(path: Union[str, Path]) -> bool:
+    """
+    Convert a legacy pickled database to the .npz format, once.
+
+    Handles both a pickle stored at path itself and a sibling ".pkl"
+    file when path does not exist yet (the old default location). A
+    pickle at path itself is first copied to "<name>.bak"; the sibling
+    file is left untouched.
+
+    Args:
+        path: Database file path
+
+    Returns:
+        bool: True if a legacy database was migrated
+    """
+    db_file = Path(path)
+    if db_file.exists():
+        legacy_file = db_file if not _is_npz(db_file) else None
+    else:
+        legacy_file = db_file.with_suffix('.pkl')
+        if not legacy_file.exists() or _is_npz(legacy_file):
+            legacy_file = None
+
+    if legacy_file is None:
+        return False
+
+    # The only place pickle is still read: trusted local files from older versions
+    with open(legacy_file, 'rb') as f:
+        encodings, names = from_dict(pickle.load(f))
+
+    if legacy_file == db_file:
+        backup_file = db_file.with_name(db_file.name + ".bak")
+        shutil.copy2(db_file, backup_file)
+        print(f"Backed up legacy face database to {backup_file}")
+
+    save_face_database(db_file, encodings, names)
+    print(f"Migrated legacy face database {legacy_file} -> {db_file} ({len(names)} encodings)")
+    return True
+
+
+def load_face_centroids(path: Union[str, Path]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load the per-person centroid summary of the known faces database.
+
+    Falls back to computing it from the samples for databases saved
+    without one (including legacy pickles) or with cosine radii.
+
+    Returns:
+        Tuple of (person names, centroids, radii); see compute_centroids()
+    """
+    db_file = Path(path)
+    migrate_legacy_database(db_file)
+
+    if db_file.exists():
+        with np.load(db_file, allow_pickle=False) as data:
+            if 'centroid_metric' in data.files and str(data['centroid_metric']) == CENTROID_METRIC:
+                return data['centroid_names'], data['centroids'], data['radii']
+
+    return compute_centroids(*load_face_database(db_file))
+
+
+def load_face_database(path: Union[str, Path]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Load the known faces database.
+
+    Args:
+        path: Database file path
+
+    Returns:
+        Tuple of float32 (N, 128) encodings and length-N names.
+        A missing file yields an empty database.
+    """
+    db_file = Path(path)
+    migrate_legacy_database(db_file)
+
+    if not db_file.exists():
+        return empty_database()
+
+    with open(db_file, 'rb') as f:
+        with np.load(f, allow_pickle=False) as data:
+            names = data['names']
+            if 'encodings_q' in data.files:
+                # int8 codes with a per-row scale
+                encodings = data['encodings_q'].astype(np.float32) * data['scales'][:, None]
+            else:
+                encodings = data['encodings'].astype(np.float32, copy=False)
+
+    return encodings.reshape(-1, ENCODING_SIZE), names
+
+
+def save_face_database(
+    path: Union[str, Path],
+    encodings: np.ndarray,
+    names: np.ndarray,
+    quantize: Optional[str] = None
+) -> None:
+    """
+    Save the known faces database.
+
+    The file is written to a temporary sibling and renamed into place,
+    so an interrupted save never leaves a truncated database.
+
+    Args:
+        path: Database file path (written as-is, no suffix is added)
+        encodings: (N, 128) face encodings
+        names: Length-N person names, one per encoding row
+        quantize: None to store float32, or "int8" for per-row
+            scalar quantization
+    """
+    encodings = np.asarray(encodings, dtype=np.float32).reshape(-1, ENCODING_SIZE)
+    names = np.asarray(names, dtype=str)
+    if len(names) != len(encodings):
+        raise ValueError(f"Got {len(encodings)} encodings but {len(names)} names")
+
+    if quantize is None:
+        arrays = {'encodings': encodings}
+    elif quantize == "int8":
+        scales = (np.abs(encodings).max(axis=1) / 127.0).astype(np.float32)
+        scales[scales == 0] = 1.0
+        codes = np.round(encodings / scales[:, None]).astype(np.int8)
+        arrays = {'encodings_q': codes, 'scales': scales}
+        # The summary must bound the encodings as they will be loaded
+        encodings = codes.astype(np.float32) * scales[:, None]
+    else:
+        raise ValueError(f"Unsupported quantization {quantize!r}, expected one of {QUANTIZE_MODES}")
+
+    # Per-person summary, computed from the encodings as stored
+    centroid_names, centroids, radii = compute_centroids(encodings, names)
+
+    db_file = Path(path)
+    db_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write through a file handle so numpy does not append ".npz"
+    tmp_file = db_file.with_name(db_file.name + ".tmp")
+    try:
+        with open(tmp_file, 'wb') as f:
+            np.savez_compressed(
+                f, names=names, centroid_names=centroid_names,
+                centroids=centroids, radii=radii,
+                centroid_metric=np.array(CENTROID_METRIC), **arrays
+            )
+        os.replace(tmp_file, db_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,63 @@
+"""
+Face Matcher Module - Nearest Known Face Search
+
+Finds the known face encoding closest to a query encoding in the SoA
+face database (float32 (N, 128) matrix, see face_database.py).
+
+Uses a Numba-compiled kernel when numba is installed and falls back to
+vectorized NumPy otherwise. Both return identical results. The kernel
+releases the GIL and stays single-threaded: it runs next to the stream
+and Telegram threads, and a parallel kernel would keep its worker pool
+spinning between the intermittent face lookups.
+
+Usage:
+    from src.detection.face_matcher import match
+
+    index, distance = match(known_encodings, face_encoding)
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True, nogil=True, boundscheck=False)
+    def _squared_distances(encodings, query):
+        """Squared L2 distance from query to every row."""
+        n, dim = encodings.shape
+        out = np.empty(n, dtype=np.float32)
+        for i in range(n):
+            d = np.float32(0.0)
+            for k in range(dim):
+                diff = encodings[i, k] - query[k]
+                d += diff * diff
+            out[i] = d
+        return out
+else:
+    def _squared_distances(encodings, query):
+        """Squared L2 distance from query to every row."""
+        diff = encodings - query
+        return np.einsum('ij,ij->i', diff, diff)
+
+
+def match(encodings: np.ndarray, query: np.ndarray) -> Tuple[int, float]:
+    """
+    Find the closest known encoding to a query.
+
+    Args:
+        encodings: Known face encodings, float32 (N, 128), N > 0
+        query: Face encoding to look up (128,)
+
+    Returns:
+        Tuple of (row index of the best match, Euclidean distance)
+    """
+    query = np.ascontiguousarray(query, dtype=np.float32)
+    distances = _squared_distances(encodings, query)
+    best = int(np.argmin(distances))
+    return best, float(np.sqrt(distances[best]))
@@ -18,14 +18,21 @@ Usage:
 
 import cv2
 import numpy as np
-import pickle
 from pathlib import Path
 from typing import List, Dict, Optional
 import face_recognition
 
 from src.detection.yolo_detector import DetectionType, AlertLevel
+from src.detection.face_database import (
+    compute_centroids, empty_database, load_face_centroids, load_face_database,
+    migrate_legacy_database, save_face_database
+)
+from src.detection.face_matcher import match
 from config.settings import settings
 
+# Slack added to radius + tolerance so float32 rounding never prunes a match
+_PRUNE_EPSILON = 1e-4
+
 
 class FaceRecognitionDetector:
     """
@@ -47,9 +54,12 @@ class FaceRecognitionDetector:
         self.database_path = database_path or settings.known_faces_db
         self.tolerance = tolerance or settings.face_recognition_tolerance
         
-        # Known faces database
-        self.known_face_encodings = {}  
+        # Known faces database (SoA): float32 (N, 128) encodings + N names
+        self.known_encodings, self.known_names = empty_database()
         self.model_loaded = False
+
+        # Per-person centroid/radius summary and each person's database rows
+        self._set_centroids(*compute_centroids(self.known_encodings, self.known_names))
         
         # Statistics
         self.inference_count = 0
@@ -67,29 +77,33 @@ class FaceRecognitionDetector:
         try:
             db_file = Path(self.database_path)
             
+            # Convert an old pickled database (if any) before checking for one
+            migrate_legacy_database(db_file)
+            
             if not db_file.exists():
                 print(f"⚠️  Database not found at {self.database_path}")
                 print("   Creating empty database. Use register_person.py to add people.")
                 
                 # Create empty database
-                db_file.parent.mkdir(parents=True, exist_ok=True)
-                self.known_face_encodings = {}
+                self.known_encodings, self.known_names = empty_database()
+                self._set_centroids(*compute_centroids(self.known_encodings, self.known_names))
                 self._save_database()
                 self.model_loaded = True
                 return True
             
             # Load database
             print(f"Loading face recognition database: {self.database_path}")
-            with open(db_file, 'rb') as f:
-                self.known_face_encodings = pickle.load(f)
+            self.known_encodings, self.known_names = load_face_database(db_file)
+            self._set_centroids(*load_face_centroids(db_file))
             
             # Log loaded persons
-            person_count = len(self.known_face_encodings)
+            known_persons = self.known_persons
+            person_count = len(known_persons)
             print(f"✓ Face Recognition model loaded successfully!")
             print(f"  - Database: {self.database_path}")
-            print(f"  - Known persons: {person_count}")
+            print(f"  - Known persons: {person_count} ({len(self.known_names)} encodings)")
             if person_count > 0:
-                print(f"  - Names: {', '.join(self.known_face_encodings.keys())}")
+                print(f"  - Names: {', '.join(known_persons)}")
             print(f"  - Tolerance: {self.tolerance}")
             
             self.model_loaded = True
@@ -210,25 +224,33 @@ class FaceRecognitionDetector:
         Recognize a face by comparing with known faces database.
         """
         # If no known faces, all are unknown
-        if len(self.known_face_encodings) == 0:
+        if len(self.known_names) == 0:
             return ("Unknown Person", 0.5, False)
         
-        # Compare with all known faces
-        best_match_name = "Unknown Person"
-        best_match_distance = 1.0  # Max distance
-        is_authorized = False
-        
-        for name, encodings_list in self.known_face_encodings.items():
-            # Compare with all encodings for this person
-            distances = face_recognition.face_distance(encodings_list, face_encoding)
-            min_distance = np.min(distances)
+        # One distance per person: only persons whose centroid is within
+        # radius + tolerance can have a sample within tolerance
+        face_encoding = np.asarray(face_encoding, dtype=np.float32)
+        centroid_distances = np.linalg.norm(self._centroids - face_encoding, axis=1)
+        candidates = np.flatnonzero(
+            centroid_distances <= self._radii + self.tolerance + _PRUNE_EPSILON
+        )
 
-            # Check if this is the best match so far
-            if min_distance < best_match_distance:
-                best_match_distance = min_distance
-                if min_distance <= self.tolerance:
-                    best_match_name = name
-                    is_authorized = True
+        if len(candidates) == 0:
+            # No sample can match; the nearest person's samples still give
+            # a real distance for the confidence
+            candidates = [int(np.argmin(centroid_distances))]
+
+        # Compare with the candidates' samples only
+        rows = np.concatenate([self._person_rows[i] for i in candidates])
+        best_row, best_match_distance = match(self.known_encodings[rows], face_encoding)
+        best_index = rows[best_row]
+
+        if best_match_distance <= self.tolerance:
+            best_match_name = str(self.known_names[best_index])
+            is_authorized = True
+        else:
+            best_match_name = "Unknown Person"
+            is_authorized = False
         
         # Convert distance to confidence (0-1)
         confidence = 1.0 - min(best_match_distance, 1.0)
@@ -310,13 +332,20 @@ class FaceRecognitionDetector:
             'animal_count': 0
         }
     
+    def _set_centroids(self, persons: np.ndarray, centroids: np.ndarray, radii: np.ndarray) -> None:
+        """Store the per-person summary and map each person to their rows."""
+        self._centroids = centroids
+        self._radii = radii
+        self._person_rows = [np.flatnonzero(self.known_names == person) for person in persons]
+
+    @property
+    def known_persons(self) -> List[str]:
+        """Names of known persons, in database order."""
+        return list(dict.fromkeys(self.known_names.tolist()))
+    
     def _save_database(self) -> None:
         """Save known faces database to file."""
-        db_file = Path(self.database_path)
-        db_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(db_file, 'wb') as f:
-            pickle.dump(self.known_face_encodings, f)
+        save_face_database(self.database_path, self.known_encodings, self.known_names)
     
     def add_person(self, name: str, encodings: List[np.ndarray]) -> bool:
         """
@@ -330,7 +359,12 @@ class FaceRecognitionDetector:
             bool: True if added successfully
         """
         try:
-            self.known_face_encodings[name] = encodings
+            # Replace any existing encodings for this person
+            keep = self.known_names != name
+            new_encodings = np.asarray(encodings, dtype=np.float32).reshape(-1, self.known_encodings.shape[1])
+            self.known_encodings = np.concatenate([self.known_encodings[keep], new_encodings])
+            self.known_names = np.concatenate([self.known_names[keep], np.full(len(new_encodings), name)])
+            self._set_centroids(*compute_centroids(self.known_encodings, self.known_names))
             self._save_database()
             print(f"✓ Added {name} to database ({len(encodings)} encodings)")
             return True
@@ -365,7 +399,7 @@ class FaceRecognitionDetector:
             'authorized_rate': authorized_rate,
             'unknown_rate': unknown_rate,
             'model_loaded': self.model_loaded,
-            'known_persons': list(self.known_face_encodings.keys()),
+            'known_persons': self.known_persons,
             'tolerance': self.tolerance
         }
     
@@ -386,7 +420,7 @@ class FaceRecognitionDetector:
     def __repr__(self) -> str:
         """String representation."""
         status = "loaded" if self.model_loaded else "not loaded"
-        person_count = len(self.known_face_encodings)
+        person_count = len(self.known_persons)
         return f"<FaceRecognitionDetector: {person_count} persons, tolerance={self.tolerance}, {status}>"
 
 
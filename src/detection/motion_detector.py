@@ -33,6 +33,18 @@ from typing import Tuple, List, Optional
 
 from config.settings import settings
 
+# Structuring element used to fill holes in the foreground mask
+_DILATE_KERNEL = np.ones((5, 5), np.uint8)
+
+# Small structuring element used by has_motion() to drop speckle noise
+_OPEN_KERNEL = np.ones((3, 3), np.uint8)
+
+# has_motion() compares grayscale thumbnails of this size (width, height)
+_GATE_SIZE = (160, 120)
+
+# Gray-level change of a thumbnail pixel that counts as motion
+_GATE_DIFF_THRESHOLD = 25
+
 
 class MotionDetector:
     """
@@ -71,13 +83,34 @@ class MotionDetector:
         self.bg_subtractor = cv2.createBackgroundSubtractorMOG2(
             history=500,
             varThreshold=16,
-            detectShadows=True
+            detectShadows=False
         )
 
+        # Run the mask pipeline on OpenCL (cv2.UMat) when the device has it.
+        # Every frame must take the same path: MOG2 keeps separate CPU and
+        # OpenCL background models
+        self._use_umat = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+
+        # Previous thumbnail for has_motion() frame differencing
+        self._prev_thumb = None
+
         # Statistics
         self.frame_count = 0
         self.motion_count = 0
 
+    def _preprocess(self, frame: np.ndarray):
+        """Grayscale and blur a frame, as a cv2.UMat when OpenCL is in use."""
+        if self._use_umat:
+            frame = cv2.UMat(frame)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return cv2.GaussianBlur(gray, self.blur_kernel, 0)
+
+    def _motion_mask(self, frame: np.ndarray):
+        """Thresholded foreground mask, left on the device when OpenCL is in use."""
+        fg_mask = self.bg_subtractor.apply(self._preprocess(frame))
+        _, thresh = cv2.threshold(fg_mask, self.threshold_value, 255, cv2.THRESH_BINARY)
+        return thresh
+
     def detect(
         self,
         frame: np.ndarray,
@@ -89,21 +122,13 @@ class MotionDetector:
         if frame is None:
             return False
         
-        # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-
-        # Apply Gaussian blur to reduce noise
-        blurred = cv2.GaussianBlur(gray, self.blur_kernel, 0)
-
-        # Apply background subtractor to get foreground mask
-        fg_mask = self.bg_subtractor.apply(blurred)
-
-        # Apply threshold to binary image
-        _, thresh = cv2.threshold(fg_mask, self.threshold_value, 255, cv2.THRESH_BINARY)
+        # Grayscale, blur, background subtraction and threshold
+        thresh = self._motion_mask(frame)
 
         # Dilate to fill holes in detect objects
-        kernel = np.ones((5, 5), np.uint8)
-        dilated = cv2.dilate(thresh, kernel, iterations=2)
+        dilated = cv2.dilate(thresh, _DILATE_KERNEL, iterations=2)
+        if isinstance(dilated, cv2.UMat):
+            dilated = dilated.get()
 
         # Find contours in binary image
         contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -138,9 +163,11 @@ class MotionDetector:
         self.bg_subtractor = cv2.createBackgroundSubtractorMOG2(
             history=500,
             varThreshold=16,
-            detectShadows=True
+            detectShadows=False
         )
 
+        self._prev_thumb = None
+
         # Reset counters
         self.frame_count = 0
         self.motion_count = 0
@@ -151,20 +178,48 @@ class MotionDetector:
         """
         if frame is None:
             return None
-        
-         # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
-        # Blur
-        blurred = cv2.GaussianBlur(gray, self.blur_kernel, 0)
+        thresh = self._motion_mask(frame)
+        return thresh.get() if isinstance(thresh, cv2.UMat) else thresh
 
-        # Apply backround subtractor
-        fg_mask = self.bg_subtractor.apply(blurred)
-        
-        # Threshold
-        _, thresh = cv2.threshold(fg_mask, self.threshold_value, 255, cv2.THRESH_BINARY)
+    def has_motion(self, frame: np.ndarray, min_pixels: Optional[int] = None) -> bool:
+        """
+        Cheap motion check used to gate heavier detectors.
 
-        return thresh
+        Differences a 160x120 grayscale thumbnail against the previous
+        call's, opens the thresholded difference with a small kernel and
+        counts changed pixels. No background model or contours, so it
+        costs well under a millisecond. The first call reports no motion.
+
+        Args:
+            frame: BGR frame
+            min_pixels: Changed full-resolution pixels needed to count as
+                motion (default min_area); scaled down to the thumbnail
+        """
+        if frame is None:
+            return False
+
+        thumb = cv2.cvtColor(
+            cv2.resize(frame, _GATE_SIZE, interpolation=cv2.INTER_AREA),
+            cv2.COLOR_BGR2GRAY
+        )
+        prev, self._prev_thumb = self._prev_thumb, thumb
+        if prev is None or prev.shape != thumb.shape:
+            return False
+
+        diff = cv2.absdiff(thumb, prev)
+        _, mask = cv2.threshold(diff, _GATE_DIFF_THRESHOLD, 255, cv2.THRESH_BINARY)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, _OPEN_KERNEL)
+
+        scale = (_GATE_SIZE[0] * _GATE_SIZE[1]) / (frame.shape[0] * frame.shape[1])
+        moving = cv2.countNonZero(mask) > (min_pixels or self.min_area) * scale
+
+        # Update statistics
+        self.frame_count += 1
+        if moving:
+            self.motion_count += 1
+
+        return moving
 
 
     def calibrate(self, frames: List[np.ndarray]) -> None:
@@ -177,10 +232,8 @@ class MotionDetector:
         # Process each frame to build backround model
         for frame in frames:
             if frame is not None:
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                blurred = cv2.GaussianBlur(gray, self.blur_kernel, 0)
                 # Apply with high learning rate for faster calibration
-                self.bg_subtractor.apply(blurred, learningRate=0.5)
+                self.bg_subtractor.apply(self._preprocess(frame), learningRate=0.5)
 
 
 
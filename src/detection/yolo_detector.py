@@ -31,6 +31,7 @@ Usage:
 
 import cv2
 import numpy as np
+import torch
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from enum import Enum
@@ -38,6 +39,22 @@ from ultralytics import YOLO
 
 from config.settings import settings
 
+# Ultralytics export formats usable in place of the .pt checkpoint, and the
+# file/directory suffix each export is cached under next to it
+EXPORT_SUFFIXES = {
+    "engine": ".engine",              # TensorRT (NVIDIA GPU, FP16)
+    "openvino": "_openvino_model",    # OpenVINO IR (Intel CPU/iGPU)
+}
+
+# INT8 OpenVINO model built by scripts/quantize_yolo.py, preferred over FP32
+INT8_OPENVINO_SUFFIX = "_int8_openvino_model"
+
+# Input size must be a multiple of the model's largest stride
+MODEL_STRIDE = 32
+
+# Grey used to pad letterboxed frames (same as Ultralytics' LetterBox)
+LETTERBOX_PAD_VALUE = 114
+
 
 class DetectionType(Enum):
     """Detection classification types."""
@@ -91,8 +108,19 @@ class YOLODetector:
         self.model_path = model_path or f"models/{settings.yolo_model}"
         self.confidence = confidence or settings.yolo_confidence
         self.img_size = img_size or settings.yolo_img_size
+        # Round up to the stride, as Ultralytics' check_imgsz would
+        # (it is skipped when the model is fed a ready-made tensor)
+        stride_size = max(MODEL_STRIDE, -(-self.img_size // MODEL_STRIDE) * MODEL_STRIDE)
+        if stride_size != self.img_size:
+            print(f"WARNING: YOLO image size {self.img_size} is not a multiple of "
+                  f"{MODEL_STRIDE}, using {stride_size}")
+            self.img_size = stride_size
+        self.export_format = settings.yolo_export_format.strip().lower()
+        self.batch_size = max(1, settings.yolo_batch_size)
 
         self.model = None
+        # Fixed batch of a static-shape export (None = any batch size)
+        self.export_batch = None
         self.model_loaded = False
 
         # Statistics
@@ -137,6 +165,10 @@ class YOLODetector:
             if self.model is None:
                 print("ERROR: Failed to load YOLO model")
                 return False
+
+            # Swap in a shape-specialized export if one is configured
+            if self.export_format:
+                self.model = self._load_exported_model(self.model)
             
             # Set model_loaded flag
             self.model_loaded = True
@@ -158,10 +190,124 @@ class YOLODetector:
             return False
 
 
+    def _load_exported_model(self, model):
+        """
+        Load a static-shape export of the model, exporting it once if needed.
+
+        The export is built for the fixed img_size x img_size input that
+        preprocess() produces and for batch_size frames per pass, and cached
+        next to the .pt checkpoint (with a _b<N> tag for batches above 1),
+        so later runs load it directly. For OpenVINO, an INT8 model from
+        scripts/quantize_yolo.py (batch 1) is used when present. Falls back
+        to the given PyTorch model if the format is unknown or the export
+        toolchain is unavailable.
+        """
+        suffix = EXPORT_SUFFIXES.get(self.export_format)
+        if suffix is None:
+            print(f"WARNING: Unknown YOLO export format '{self.export_format}', "
+                  f"expected one of {list(EXPORT_SUFFIXES)}")
+            return model
+
+        try:
+            # Ultralytics may have resolved the checkpoint to another name
+            checkpoint = Path(getattr(model, 'ckpt_path', None) or self.model_path)
+            batch_tag = f"_b{self.batch_size}" if self.batch_size > 1 else ""
+            export_path = checkpoint.with_name(checkpoint.stem + batch_tag + suffix)
+            export_batch = self.batch_size
+            int8_path = checkpoint.with_name(checkpoint.stem + INT8_OPENVINO_SUFFIX)
+            if self.export_format == "openvino" and int8_path.exists():
+                export_path = int8_path
+                export_batch = 1
+
+            if not export_path.exists():
+                print(f"Exporting YOLO model to {self.export_format} "
+                      f"({export_batch}x{self.img_size}x{self.img_size}, one-time)...")
+                exported = Path(model.export(
+                    format=self.export_format,
+                    imgsz=self.img_size,
+                    batch=export_batch,
+                    half=self.export_format == "engine",
+                    dynamic=False
+                ))
+                # Ultralytics always writes <stem><suffix>; keep batch variants apart
+                if exported != export_path:
+                    exported.rename(export_path)
+
+            exported_model = YOLO(str(export_path), task='detect')
+            self.export_batch = export_batch
+            print(f"Using {self.export_format} model: {export_path} (batch {export_batch})")
+            return exported_model
+
+        except Exception as e:
+            print(f"WARNING: {self.export_format} export unavailable ({e}), using PyTorch model")
+            return model
+
+    def _letterbox_params(self, height: int, width: int) -> Tuple[float, int, int, int, int]:
+        """
+        Geometry of the letterbox for a frame size.
+
+        Returns:
+            Tuple of (scale ratio, resized width, resized height,
+            left padding, top padding)
+        """
+        ratio = min(self.img_size / height, self.img_size / width)
+        new_w = int(round(width * ratio))
+        new_h = int(round(height * ratio))
+        return ratio, new_w, new_h, (self.img_size - new_w) // 2, (self.img_size - new_h) // 2
+
+    def _letterbox(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Resize a frame keeping its aspect ratio and pad it to img_size x img_size.
+
+        Matches the letterboxed input the models are trained on.
+        """
+        h, w = frame.shape[:2]
+        _, new_w, new_h, left, top = self._letterbox_params(h, w)
+        if (new_w, new_h) != (w, h):
+            frame = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+        return cv2.copyMakeBorder(
+            frame,
+            top, self.img_size - new_h - top,
+            left, self.img_size - new_w - left,
+            cv2.BORDER_CONSTANT,
+            value=(LETTERBOX_PAD_VALUE,) * 3
+        )
+
+    def preprocess(self, frame: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Turn a BGR frame into the model input tensor.
+
+        Letterbox to img_size x img_size, then BGR->RGB, scale to 0-1 and
+        HWC->CHW in a single fused OpenCV call (instead of Ultralytics'
+        per-step NumPy preprocessing).
+
+        Args:
+            frame: Input frame (BGR color image)
+            out: Optional reusable float32 (1, 3, img_size, img_size)
+                buffer to write the tensor into instead of allocating one
+
+        Returns:
+            np.ndarray: float32 array of shape (1, 3, img_size, img_size)
+        """
+        if out is not None:
+            # Same transform as blobFromImage (which cannot write into a
+            # given buffer); only the small uint8 intermediates are allocated
+            rgb = cv2.cvtColor(self._letterbox(frame), cv2.COLOR_BGR2RGB)
+            np.multiply(rgb.transpose(2, 0, 1), np.float32(1.0 / 255.0), out=out[0])
+            return out
+
+        return cv2.dnn.blobFromImage(
+            self._letterbox(frame),
+            scalefactor=1.0 / 255.0,
+            swapRB=True,
+            crop=False
+        )
+
     def detect(
         self,
         frame: np.ndarray,
-        draw: bool = False
+        draw: bool = False,
+        input_tensor: Optional[np.ndarray] = None
     ) -> Dict:
         """
         Detect objects in frame and classify as person/animal/both.
@@ -169,6 +315,7 @@ class YOLODetector:
         Args:
             frame: Input frame (BGR color image)
             draw: If True, draw bounding boxes on frame
+            input_tensor: Output of preprocess(frame), if already computed
 
         Returns:
             Dict containing:
@@ -189,113 +336,200 @@ class YOLODetector:
             if not self.model_loaded:
                 print("Model not loaded, attempting to load...")
                 if not self.load_model():
-                    return {
-                        'type': DetectionType.NONE,
-                        'alert_level': AlertLevel.NONE,
-                        'detections': [],
-                        'frame': frame.copy() if draw else None,
-                        'person_count': 0,
-                        'animal_count': 0,
-                    }
-            # 2. Keep the original frame
-            original_frame = frame.copy()
-            inference_frame = frame
-
-            # 3. Run inference
-            results = self.model(
-                inference_frame,
-                conf = self.confidence,
-                imgsz = self.img_size,
-                verbose = False
-            )
+                    return self._empty_result(frame, draw)
+            # 2. Preprocess (unless the caller already did)
+            if input_tensor is None:
+                input_tensor = self.preprocess(frame)
 
-            # 4. Parse the results
-            detections = []
-            person_count = 0
-            animal_count = 0
+            # 3. Run inference on the ready-made tensor
+            results = self._infer_batch(input_tensor)
 
             # Get the first result (single image inference)
-            result = results[0]
-
-            # Extract boxes, classes and confidence
-            if result.boxes is not None and len(result.boxes) > 0:
-                boxes = result.boxes.xyxy.cpu().numpy()
-                classes = result.boxes.cls.cpu().numpy()
-                confidences = result.boxes.conf.cpu().numpy()
-
-                # Process each detection
-                for i in range(len(boxes)):
-                    class_id = int(classes[i])
-                    conf_score = float(confidences[i])
-                    bbox = boxes[i].tolist()
-
-                    #Classify detection
-                    classification = self._classify_detection(class_id)
-
-
-                    # Skip detection that are not person or animal
-                    if classification == "other" :
-                        continue
-
-                    #Count person or animal
-                    if classification == "person":
-                        person_count += 1
-                    elif classification == "animal":
-                        animal_count += 1
-                    
-                    # Get class name
-                    class_name = self.get_class_name(class_id)
-
-                    # Add detection to list
-                    detections.append({
-                        'class': class_id,
-                        'class_name' : class_name,
-                        'confidence' : conf_score,
-                        'bbox': bbox,
-                        'classification' : classification,
-                    })
-
-            # 5. Determine detection type
-            if person_count > 0 and animal_count > 0:
-                detection_type = DetectionType.BOTH
-            elif person_count > 0:
-                detection_type = DetectionType.PERSON
-            elif animal_count > 0:
-                detection_type = DetectionType.ANIMAL
-            else:
-                detection_type = DetectionType.NONE
-            
-            # 6. Determine alert level
-            alert_level = self._determine_alert_level(person_count, animal_count)
-
-            # 7. Draw detection if requested
-            annotated_frame = None
-            if draw:
-                annotated_frame = self._draw_detections(original_frame, detections)
-            
-            # 8. Increment statistics
-            self.inference_count += 1
-            if person_count > 0:
-                self.person_detections += 1
-            if animal_count > 0:
-                self.animal_detections += 1
-
-            # 9. Return results dictionary
-            return {
-                'type': detection_type,
-                'alert_level': alert_level,
-                'detections': detections,
-                'frame': annotated_frame,
-                'person_count': person_count,
-                'animal_count': animal_count,
-            }
+            return self._parse_result(frame, results[0], draw)
 
         except Exception as e:
             print(f"ERROR in detect(): {e}")
             import traceback
             traceback.print_exc()
 
-            return {
+            return self._empty_result(frame, draw)
+
+    def detect_batch(
+        self,
+        frames: List[np.ndarray],
+        draw: bool = False,
+        input_tensors: Optional[List[np.ndarray]] = None
+    ) -> List[Dict]:
+        """
+        Detect objects in several frames with a single forward pass.
+
+        Frames are letterboxed and converted together with
+        cv2.dnn.blobFromImages (or
+        the given per-frame tensors are stacked) and run as one
+        (N, 3, img_size, img_size) batch.
+
+        Args:
+            frames: Input frames (BGR color images)
+            draw: If True, draw bounding boxes on each frame
+            input_tensors: Output of preprocess() for each frame, or one
+                stacked (N, 3, img_size, img_size) array, if already computed
+
+        Returns:
+            List of detect() result dicts, one per frame, in order
+        """
+        if not frames:
+            return []
+
+        try:
+            if not self.model_loaded:
+                print("Model not loaded, attempting to load...")
+                if not self.load_model():
+                    return [self._empty_result(frame, draw) for frame in frames]
+
+            if isinstance(input_tensors, np.ndarray):
+                batch = input_tensors  # Already stacked (N, 3, H, W)
+            elif input_tensors is not None:
+                batch = np.concatenate(input_tensors)
+            else:
+                batch = cv2.dnn.blobFromImages(
+                    [self._letterbox(frame) for frame in frames],
+                    scalefactor=1.0 / 255.0,
+                    swapRB=True,
+                    crop=False
+                )
+            results = self._infer_batch(batch)
+
+            return [
+                self._parse_result(frame, result, draw)
+                for frame, result in zip(frames, results)
+            ]
+
+        except Exception as e:
+            print(f"ERROR in detect_batch(): {e}")
+            import traceback
+            traceback.print_exc()
+
+            return [self._empty_result(frame, draw) for frame in frames]
+
+    def _infer_batch(self, batch: np.ndarray) -> list:
+        """
+        Run the model on an (N, 3, H, W) batch, one result per frame.
+
+        A static-shape export only accepts exactly export_batch frames, so
+        the batch is run in chunks of that size, padding the last one by
+        repeating its final frame (the padded results are dropped).
+        """
+        step = self.export_batch or len(batch)
+        results = []
+        for start in range(0, len(batch), step):
+            chunk = batch[start:start + step]
+            n = len(chunk)
+            if n < step:
+                chunk = np.concatenate([chunk, np.repeat(chunk[-1:], step - n, axis=0)])
+
+            chunk_results = self.model(
+                torch.from_numpy(np.ascontiguousarray(chunk)),
+                conf = self.confidence,
+                verbose = False
+            )
+            results.extend(chunk_results[:n])
+        return results
+
+    def _parse_result(self, frame: np.ndarray, result, draw: bool) -> Dict:
+        """
+        Turn one Ultralytics result into a detect() result dict.
+        """
+        # Boxes come back in input tensor coordinates; map to the frame
+        h, w = frame.shape[:2]
+        ratio, _, _, left, top = self._letterbox_params(h, w)
+        box_offset = np.array([left, top, left, top], dtype=np.float32)
+        box_limit = np.array([w, h, w, h], dtype=np.float32)
+
+        # 4. Parse the results
+        detections = []
+        person_count = 0
+        animal_count = 0
+
+        # Extract boxes, classes and confidence
+        if result.boxes is not None and len(result.boxes) > 0:
+            # Undo the letterbox padding and scale, clipped to the frame
+            boxes = (result.boxes.xyxy.cpu().numpy() - box_offset) / ratio
+            boxes = np.clip(boxes, 0, box_limit)
+            classes = result.boxes.cls.cpu().numpy()
+            confidences = result.boxes.conf.cpu().numpy()
+
+            # Process each detection
+            for i in range(len(boxes)):
+                class_id = int(classes[i])
+                conf_score = float(confidences[i])
+                bbox = boxes[i].tolist()
+
+                #Classify detection
+                classification = self._classify_detection(class_id)
+
+
+                # Skip detection that are not person or animal
+                if classification == "other" :
+                    continue
+
+                #Count person or animal
+                if classification == "person":
+                    person_count += 1
+                elif classification == "animal":
+                    animal_count += 1
+                
+                # Get class name
+                class_name = self.get_class_name(class_id)
+
+                # Add detection to list
+                detections.append({
+                    'class': class_id,
+                    'class_name' : class_name,
+                    'confidence' : conf_score,
+                    'bbox': bbox,
+                    'classification' : classification,
+                })
+
+        # 5. Determine detection type
+        if person_count > 0 and animal_count > 0:
+            detection_type = DetectionType.BOTH
+        elif person_count > 0:
+            detection_type = DetectionType.PERSON
+        elif animal_count > 0:
+            detection_type = DetectionType.ANIMAL
+        else:
+            detection_type = DetectionType.NONE
+        
+        # 6. Determine alert level
+        alert_level = self._determine_alert_level(person_count, animal_count)
+
+        # 7. Draw detection if requested
+        annotated_frame = None
+        if draw:
+            annotated_frame = self._draw_detections(frame, detections)
+        
+        # 8. Increment statistics
+        self.inference_count += 1
+        if person_count > 0:
+            self.person_detections += 1
+        if animal_count > 0:
+            self.animal_detections += 1
+
+        # 9. Return results dictionary
+        return {
+            'type': detection_type,
+            'alert_level': alert_level,
+            'detections': detections,
+            'frame': annotated_frame,
+            'person_count': person_count,
+            'animal_count': animal_count,
+        }
+
+    def _empty_result(self, frame: np.ndarray, draw: bool) -> Dict:
+        """
+        detect() result for a frame that could not be processed.
+        """
+        return {
             'type': DetectionType.NONE,
             'alert_level': AlertLevel.NONE,
             'detections': [],
@@ -304,11 +538,6 @@ class YOLODetector:
             'animal_count': 0,
         }
 
-
-
-
-
-
     def _classify_detection(self, class_id: int) -> str:
         """
         Classify detection as person or animal.
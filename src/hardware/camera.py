@@ -4,6 +4,10 @@ Camera Module - USB Webcam Interface
 This module handles video capture from USB webcam.
 Implements threaded frame capture for better performance.
 
+The capture thread only grab()s frames, which keeps the driver buffer
+drained so the newest frame is always at hand. Decoding (retrieve()) is
+done on demand, only when a consumer is waiting in get_frame().
+
 Responsibilities:
 - Initialize USB camera with OpenCV
 - Continuous frame capture in separate thread
@@ -28,11 +32,18 @@ Usage:
 import cv2
 import threading
 import time
-from queue import Queue, Empty
+from queue import Queue, Empty, Full
 from typing import Optional, Tuple
 import numpy as np
 
 from config.settings import settings
+from src.utils.helpers import CAPTURE_CORE, pin_current_thread
+
+
+# Decoded frames buffered between the capture thread and consumers. With
+# one slot a consumer always gets the newest frame and a slow detection
+# stage never works through a backlog of stale frames.
+FRAME_QUEUE_SIZE = 1
 
 
 class Camera:
@@ -73,8 +84,9 @@ class Camera:
         self.stopped = False  # Flag to stop capture thread
         self.lock = threading.Lock()  # Thread lock for frame access
 
-        # Frame queue (keep only latest frames)
-        self.frame_queue = Queue(maxsize=2)
+        # Frame queue (keep only the latest frame)
+        self.frame_queue = Queue(maxsize=FRAME_QUEUE_SIZE)
+        self._waiting = 0  # Consumers blocked in get_frame()
 
         # Statistics
         self.frame_count = 0
@@ -141,6 +153,9 @@ class Camera:
         self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
         self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
         self.capture.set(cv2.CAP_PROP_FPS, self.fps)
+        # Keep a single buffered frame in the driver instead of the default
+        # backlog of ~4, which delays every frame by several frame times
+        self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
         # Get actual resolution
         actual_width = int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -150,15 +165,15 @@ class Camera:
         # Start capture thread
         self.stopped = False
         self.start_time = time.time()
-        self.thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self.thread = threading.Thread(target=self._capture_loop, daemon=True, name="CameraCapture")
         self.thread.start()  # IMPORTANT!
 
         # Wait for first frame
         time.sleep(0.5)
         
         # Verify frames are being captured
-        if not self.frame_queue.empty():
-            print(f"✓ Capturing frames ({self.frame_count} in queue)")
+        if self.frame_count > 0:
+            print(f"✓ Capturing frames ({self.frame_count} grabbed)")
         else:
             print("⚠ Warning: No frames captured yet")
 
@@ -168,45 +183,48 @@ class Camera:
     def _capture_loop(self) -> None:
         """
         Main capture loop (runs in separate thread).
-        Continuously reads frames from camera and puts them in queue.
-        Discards old frames if queue is full (keep only latest).
+        Continuously grabs frames so the camera buffer never holds stale
+        ones, and decodes a frame into the queue only when a consumer is
+        waiting for it.
         """
+        pin_current_thread(CAPTURE_CORE)
+
         while not self.stopped:
             try:
-                # Read frame from camera
-                ret, frame = self.capture.read()
-                
-                if ret and frame is not None:
-                    # Try to put frame in queue (non-blocking)
-                    try:
-                        # If queue is full, remove old frame first
-                        if self.frame_queue.full():
-                            try:
-                                self.frame_queue.get_nowait()
-                            except Empty:
-                                pass
-                        
-                        # Put new frame in queue
-                        self.frame_queue.put(frame, block=False)
-                        self.frame_count += 1
-                        
-                    except Exception as e:
-                        # Queue operations failed, continue
-                        pass
-                else:
+                # Grab next frame (no decode)
+                if not self.capture.grab():
                     # Frame read failed
                     print(f"Warning: Failed to read frame from camera")
                     time.sleep(0.1)  # Wait before retry
-                    
+                    continue
+                self.frame_count += 1
+
+                if not self._waiting:
+                    # Nobody is waiting - drop a frame left by a timed-out consumer
+                    if not self.frame_queue.empty():
+                        try:
+                            self.frame_queue.get_nowait()
+                        except Empty:
+                            pass
+                    continue
+
+                if not self.frame_queue.empty():
+                    continue
+
+                # Decode the frame just grabbed for the waiting consumer
+                ret, frame = self.capture.retrieve()
+                if ret and frame is not None:
+                    try:
+                        self.frame_queue.put_nowait(frame)
+                    except Full:
+                        pass
+
             except Exception as e:
                 print(f"Error in capture loop: {e}")
                 time.sleep(0.1)
 
         print("Capture loop stopped")
 
-
-
-
     def get_frame(self, timeout: float = 1.0) -> Optional[np.ndarray]:
         """
         Get the latest frame from camera.
@@ -214,6 +232,9 @@ class Camera:
         Args:
             timeout: Maximum time to wait for frame (seconds)
         """
+        # Ask the capture thread to decode its next grabbed frame
+        with self.lock:
+            self._waiting += 1
         try:
             # Try to get frame from queue with timeout
             frame = self.frame_queue.get(timeout=timeout)
@@ -221,6 +242,9 @@ class Camera:
         except Empty:
             # No frame available
             return None
+        finally:
+            with self.lock:
+                self._waiting -= 1
 
     def read(self) -> Tuple[bool, Optional[np.ndarray]]:
         """
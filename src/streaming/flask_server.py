@@ -30,12 +30,23 @@ Usage:
 
 from flask import Flask, render_template, Response, jsonify, request
 from flask_cors import CORS
+import cv2
 import threading
+import time
 from typing import Optional, Callable, Generator
 import json
 from datetime import datetime
 
 from config.settings import settings
+from src.utils.helpers import STREAM_CORE, convert_to_jpeg, pin_current_thread
+
+# Make sure OpenCV uses its SIMD-optimized code paths for JPEG encoding
+cv2.setUseOptimized(True)
+
+# MJPEG stream: frames are encoded once at this rate/quality and the same
+# JPEG bytes are sent to every viewer
+STREAM_FPS = 30
+STREAM_JPEG_QUALITY = 80
 
 
 class FlaskServer:
@@ -84,6 +95,12 @@ class FlaskServer:
         self.server_thread = None
         self.running = False
 
+        # Shared MJPEG encoder: one thread encodes each frame once for all viewers
+        self.encoder_thread = None
+        self._latest_jpeg = None
+        self._frame_cond = threading.Condition()  # Notified on each new JPEG
+        self._viewers = 0
+
         # Register routes
         self._register_routes()
 
@@ -121,33 +138,70 @@ class FlaskServer:
     def video_feed(self):
         def generate():
             """Generator function for video streaming."""
-            while True:
-                # Get frame from callback
-                if self.get_frame_callback:
-                    frame = self.get_frame_callback()
-                    
-                    if frame is not None:
-                        # Encode frame as JPEG
-                        import cv2
-                        ret, buffer = cv2.imencode('.jpg', frame)
-                        
-                        if ret:
-                            frame_bytes = buffer.tobytes()
-                            
-                            # Yield frame in multipart format
-                            yield (b'--frame\r\n'
-                                b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
-                
-                # Small delay to control frame rate
-                import time
-                time.sleep(0.033)  # ~30 FPS
-
-        # Return streaming response
+            with self._frame_cond:
+                self._viewers += 1
+            try:
+                last_sent = None
+                while True:
+                    # Wait for the shared encoder to publish a new JPEG
+                    # (never re-encoded per client)
+                    with self._frame_cond:
+                        self._frame_cond.wait_for(
+                            lambda: self._latest_jpeg is not last_sent, timeout=1.0
+                        )
+                        frame_bytes = self._latest_jpeg
+
+                    if frame_bytes is None or frame_bytes is last_sent:
+                        continue
+                    last_sent = frame_bytes
+
+                    # Yield frame in multipart format
+                    yield (b'--frame\r\n'
+                        b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
+            finally:
+                with self._frame_cond:
+                    self._viewers -= 1
+
+        # Return streaming response; each yielded frame is written and
+        # flushed as its own chunk, and proxies are told not to buffer
         return Response(
             generate(),
-            mimetype='multipart/x-mixed-replace; boundary=frame'
+            mimetype='multipart/x-mixed-replace; boundary=frame',
+            direct_passthrough=True,
+            headers={
+                'Cache-Control': 'no-cache, no-store',
+                'X-Accel-Buffering': 'no',
+            }
         )
 
+    def _encode_loop(self) -> None:
+        """
+        Encode stream frames to JPEG once for all viewers (runs in thread).
+
+        Idles while nobody is watching /video_feed.
+        """
+        pin_current_thread(STREAM_CORE)
+
+        while self.running:
+            if not self._viewers or not self.get_frame_callback:
+                time.sleep(0.1)
+                continue
+
+            start = time.time()
+            try:
+                frame = self.get_frame_callback()
+                if frame is not None:
+                    jpeg = convert_to_jpeg(frame, STREAM_JPEG_QUALITY)
+                    with self._frame_cond:
+                        self._latest_jpeg = jpeg
+                        self._frame_cond.notify_all()
+            except Exception as e:
+                print(f"Stream encoder error: {e}")
+
+            remaining = 1.0 / STREAM_FPS - (time.time() - start)
+            if remaining > 0:
+                time.sleep(remaining)
+
     def api_status(self):
         """
         Get system status (API endpoint).
@@ -224,7 +278,6 @@ class FlaskServer:
             frame = self.get_frame_callback()
             
             if frame is not None:
-                import cv2
                 # Encode as JPEG
                 ret, buffer = cv2.imencode('.jpg', frame)
                 
@@ -283,6 +336,10 @@ class FlaskServer:
         # Start server
         self.server_thread.start()
 
+        # Start shared stream encoder
+        self.encoder_thread = threading.Thread(target=self._encode_loop, daemon=True, name="StreamEncoder")
+        self.encoder_thread.start()
+
         print(f"Server started at {self.get_url()}")
 
 
@@ -354,7 +411,6 @@ if __name__ == "__main__":
 
     # Keep server running
     try:
-        import time
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
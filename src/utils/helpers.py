@@ -19,6 +19,13 @@ from typing import Optional, Tuple
 import psutil
 import os
 
+# Optional: libjpeg-turbo's SIMD encoder (falls back to cv2.imencode)
+try:
+    from turbojpeg import TurboJPEG
+    _turbojpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _turbojpeg = None
+
 
 # ====================
 # Time and Date Utilities
@@ -160,8 +167,11 @@ def draw_bounding_box(
 
 def convert_to_jpeg(frame: np.ndarray, quality: int = 85) -> bytes:
     """
-    Convert frame to JPEG bytes.
+    Convert frame to JPEG bytes, with TurboJPEG when installed.
     """
+    if _turbojpeg is not None:
+        return _turbojpeg.encode(frame, quality=quality)
+
     ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality]) 
     if not ret:
         raise RuntimeError("Failed to encode frame as JPEG")
@@ -292,6 +302,34 @@ def get_system_uptime() -> float:
     return time.time() - boot_time
 
 
+# CPU cores the pipeline threads are pinned to (see pin_current_thread).
+# Only leaf threads are pinned: on Linux a new thread inherits the
+# affinity mask of the thread that starts it
+CAPTURE_CORE = 0
+STREAM_CORE = 2
+
+
+def pin_current_thread(core_id: int) -> bool:
+    """
+    Pin the calling thread to one CPU core.
+
+    Keeps pipeline threads from migrating between cores (and losing their
+    cache). Only supported on Linux, where affinity is per thread; a
+    no-op elsewhere or when the core does not exist.
+
+    Returns:
+        bool: True if the thread was pinned
+    """
+    if not hasattr(os, "sched_setaffinity") or core_id >= (os.cpu_count() or 1):
+        return False
+    try:
+        # pid 0 = the calling thread on Linux
+        os.sched_setaffinity(0, {core_id})
+        return True
+    except OSError:
+        return False
+
+
 
 
 def format_uptime(seconds: float) -> str:
@@ -23,8 +23,11 @@ Usage:
     logger.error("Camera failed")
 """
 
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -134,6 +137,45 @@ def get_logger(name: str) -> logging.Logger:
     return logger
 
 
+# Block size used by get_recent_logs() when reading the log backwards
+_TAIL_BLOCK_SIZE = 4096
+
+# Background listeners started by get_queued_logger(), keyed by logger name
+_queue_listeners = {}
+
+
+def get_queued_logger(name: str) -> logging.Logger:
+    """
+    Get a logger whose file/console output is written on a background thread.
+
+    The logger is configured like setup_logger(), but its handlers sit
+    behind a QueueHandler/QueueListener pair, so logging from a hot loop
+    only enqueues the record instead of blocking on I/O.
+
+    Args:
+        name: Logger name (usually __name__)
+
+    Returns:
+        logging.Logger: Logger instance
+    """
+    if name in _queue_listeners:
+        return logging.getLogger(name)
+
+    logger = setup_logger(name)
+    handlers = list(logger.handlers)
+    logger.handlers.clear()
+
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    _queue_listeners[name] = listener
+
+    return logger
+
+
 
 def log_system_event(event_type: str, message: str, level: str = "INFO") -> None:
     """
@@ -190,24 +232,46 @@ def log_alert(alert_level: str, message: str, sent: bool = False) -> None:
     pass
 
 
-def get_recent_logs(count: int = 20) -> list:
+def get_recent_logs(count: int = 20, log_file: Optional[str] = None) -> list:
     """
     Read recent log entries from file.
 
+    Reads fixed-size blocks backwards from the end of the file (like
+    `tail -n`), so the cost depends on `count`, not on the log size.
+
     Args:
         count: Number of recent entries to retrieve
+        log_file: Log file path (default from settings)
 
     Returns:
-        list: List of log entry strings
-
-    TODO:
-    - Open log file
-    - Read last 'count' lines
-    - Return as list
-    - Handle file not found
+        list: List of log entry strings (oldest first), empty if the
+        file does not exist
     """
-    # TODO: Implement log reading
-    pass
+    if count <= 0:
+        return []
+
+    log_path = Path(log_file or settings.log_file)
+
+    try:
+        with open(log_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+
+            # Collect blocks from the end until we have count full lines
+            blocks = []
+            newlines = 0
+            while pos > 0 and newlines <= count:
+                step = min(_TAIL_BLOCK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                block = f.read(step)
+                blocks.append(block)
+                newlines += block.count(b'\n')
+    except FileNotFoundError:
+        return []
+
+    tail = b''.join(reversed(blocks))
+    return tail.decode('utf-8', errors='replace').splitlines()[-count:]
 
 
 def clear_old_logs(days: int = 7) -> int: